@@ -26,6 +26,13 @@ def clean():
 def test():
 	subprocess.check_call(['python', '-m', 'unittest', 'discover'])
 
+def benchmark_import():
+	# -X importtime prints one line per imported module, the last one is the package itself
+	output = subprocess.check_output(['python', '-X', 'importtime', '-c', 'import simplemenus'], stderr=subprocess.STDOUT, universal_newlines=True)
+	lines = [line for line in output.splitlines() if line.startswith('import time:')]
+	print(lines[0])
+	print("\n".join(line for line in lines[1:] if 'simplemenus' in line))
+
 def run_pydoc(module):
 	subprocess.check_call(['python', '-m', 'pydoc', '-w', module])
 	shutil.move(module + '.html', 'docs/' + module + '.html')
@@ -34,6 +41,16 @@ def document():
 	run_pydoc('simplemenus')
 	run_pydoc('simplemenus.main')
 	run_pydoc('simplemenus.xgetch')
+	run_pydoc('simplemenus.forms')
+	run_pydoc('simplemenus.menutree')
+	run_pydoc('simplemenus.completion')
+	run_pydoc('simplemenus.history')
+	run_pydoc('simplemenus.fuzzy')
+	run_pydoc('simplemenus.progress')
+	run_pydoc('simplemenus.ranking')
+	run_pydoc('simplemenus.numeric')
+	run_pydoc('simplemenus.journal')
+	run_pydoc('simplemenus.model')
 	run_pydoc('simplemenus.test')
 
 def tour():
@@ -50,6 +67,7 @@ if __name__=="__main__":
 	mymenu['Clean'] = clean
 	mymenu['Dist'] = dist
 	mymenu['Run Tests'] = test
+	mymenu['Benchmark Import'] = benchmark_import
 	mymenu['Export Documentation'] = document
 	mymenu['Tour'] = tour
 
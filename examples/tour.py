@@ -6,6 +6,12 @@ from simplemenus import *
 from collections import OrderedDict
 
 def example_tour():
+	while True:
+		tour_once()
+		if not get_boolean("Do you want to do the tour again?"):
+			break
+
+def tour_once():
 	print("Your name is: " + str(get_string("Enter your name or leave empty for the default", 'guest')))
 
 	print("Your choice: " + get_option(['dog', 'cat', 'mouse'], 'Which animal do you like most?'))
@@ -30,9 +36,6 @@ def example_tour():
 		print("Your choice: " + result)
 	wait_for_enter()
 
-	if get_boolean("Do you want to do the tour again?"):
-		example_tour()
-
 def example_headlines():
 	mymenu = OrderedDict()
 	mymenu['Show headline'] = 'full'
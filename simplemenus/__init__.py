@@ -25,19 +25,70 @@ You can find more at the examples and the test direcory.
 Copyright (c) 2013, Jonas Pfannschmidt
 Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
 """
-from .main import *
-__all__=['reset_config', 
-	'configure', 
-	'wait_for_enter', 
-	'get_string', 
-	'get_character', 
-	'get_boolean', 
-	'get_integer', 
-	'get_date', 
-	'get_option', 
-	'get_from_list', 
-	'get_from_dictionary', 
-	'show_enumerated_list', 
-	'show_headline', 
-	'show_small_headline', 
-	'start_menu']
+import sys
+
+# Which module provides which public name. The modules are only imported when one
+# of their names is used first, so "import simplemenus" stays fast.
+_modules = [
+	('main', ['reset_config',
+		'configure',
+		'wait_for_enter',
+		'get_string',
+		'get_character',
+		'get_boolean',
+		'get_integer',
+		'get_number',
+		'get_range',
+		'get_numbers',
+		'get_date',
+		'get_option',
+		'get_from_list',
+		'get_from_dictionary',
+		'browse_list',
+		'search_from_list',
+		'search_from_dictionary',
+		'get_many_from_list',
+		'show_enumerated_list',
+		'show_table',
+		'get_from_table',
+		'show_headline',
+		'show_small_headline',
+		'invalidate_screen',
+		'start_menu']),
+	('completion', ['Completer']),
+	('forms', ['get_form', 'read_records']),
+	('menutree', ['load_menu_tree', 'compile_menu_tree', 'start_menu_tree']),
+	('model', ['Menu', 'MenuItem']),
+	('progress', ['Progress', 'Spinner']),
+	('xgetch', ['KEY_UP',
+		'KEY_DOWN',
+		'KEY_LEFT',
+		'KEY_RIGHT',
+		'KEY_HOME',
+		'KEY_END',
+		'KEY_PAGE_UP',
+		'KEY_PAGE_DOWN',
+		'KEY_INSERT',
+		'KEY_DELETE',
+		'KEY_ESCAPE']),
+]
+
+_module_of = dict((name, module) for module, names in _modules for name in names)
+__all__ = [name for module, names in _modules for name in names]
+
+def __getattr__(name):
+	if name not in _module_of:
+		raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+	import importlib
+	value = getattr(importlib.import_module('.' + _module_of[name], __name__), name)
+	globals()[name] = value
+	return value
+
+def __dir__():
+	return sorted(set(globals()) | set(__all__))
+
+if sys.version_info < (3, 7):
+	# no module level __getattr__ (PEP 562), import everything
+	for _name in __all__:
+		globals()[_name] = __getattr__(_name)
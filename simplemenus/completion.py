@@ -0,0 +1,160 @@
+"""
+Completion sources for get_string(completion=...).
+
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import os
+
+class _Node(object):
+	__slots__ = ('edges', 'terminal')
+
+	def __init__(self):
+		self.edges = {} # first character -> (label, child)
+		self.terminal = False
+
+class Completer(object):
+	"""
+	Completes strings from a fixed set of candidates.
+
+	The candidates are stored in a radix trie (a trie whose edges are labelled with
+	strings instead of single characters), so finding the completions of a prefix
+	takes time proportional to the length of the prefix, not to the number of
+	candidates. Build it once and pass it to get_string() for large candidate sets.
+	"""
+
+	def __init__(self, candidates = ()):
+		self._root = _Node()
+		self._size = 0
+		for candidate in candidates:
+			self.add(candidate)
+
+	def __len__(self):
+		return self._size
+
+	def __contains__(self, candidate):
+		node, text = self._find(candidate)
+		return node is not None and text == candidate and node.terminal
+
+	def add(self, candidate):
+		node = self._root
+		rest = candidate
+		while rest:
+			edge = node.edges.get(rest[0])
+			if edge is None:
+				child = _Node()
+				node.edges[rest[0]] = (rest, child)
+				node = child
+				break
+
+			label, child = edge
+			common = _common_prefix_length(label, rest)
+			if common < len(label):
+				# split the edge at the end of the common part
+				middle = _Node()
+				middle.edges[label[common]] = (label[common:], child)
+				node.edges[rest[0]] = (label[:common], middle)
+				child = middle
+
+			node = child
+			rest = rest[common:]
+
+		if not node.terminal:
+			node.terminal = True
+			self._size += 1
+
+	def complete(self, prefix):
+		"""Returns the longest string that all candidates starting with prefix share or prefix if there are none."""
+		node, text = self._find(prefix)
+		if node is None:
+			return prefix
+
+		while not node.terminal and len(node.edges) == 1:
+			label, node = next(iter(node.edges.values()))
+			text += label
+
+		return text
+
+	def candidates(self, prefix = '', limit = None):
+		"""Returns the sorted candidates that start with prefix, at most limit of them."""
+		node, text = self._find(prefix)
+		result = []
+		if node is None:
+			return result
+
+		stack = [(text, node)]
+		while stack and (limit is None or len(result) < limit):
+			text, node = stack.pop()
+			if node.terminal:
+				result.append(text)
+			for key in sorted(node.edges, reverse=True):
+				label, child = node.edges[key]
+				stack.append((text + label, child))
+
+		return result
+
+	def _find(self, prefix):
+		"""Returns the first node whose text starts with prefix and that text or (None, None)."""
+		node = self._root
+		text = ''
+		rest = prefix
+		while rest:
+			edge = node.edges.get(rest[0])
+			if edge is None:
+				return None, None
+
+			label, child = edge
+			if label.startswith(rest):
+				return child, text + label
+			if not rest.startswith(label):
+				return None, None
+
+			node = child
+			text += label
+			rest = rest[len(label):]
+
+		return node, text
+
+class _FunctionCompleter(object):
+	"""Asks a function for the candidates of a prefix."""
+
+	def __init__(self, function):
+		self._function = function
+
+	def complete(self, prefix):
+		return os.path.commonprefix(self.candidates(prefix)) or prefix
+
+	def candidates(self, prefix = '', limit = None):
+		return sorted(self._function(prefix))[:limit]
+
+_file_completers = {}
+
+def completer_for(source):
+	"""
+	Returns a completer for source.
+
+	Args:
+		source: a Completer, a function that returns the candidates for a prefix, the
+			name of a file with one candidate per line or a list of candidates
+	"""
+
+	if hasattr(source, 'candidates'):
+		return source
+	elif callable(source):
+		return _FunctionCompleter(source)
+	elif isinstance(source, str):
+		path = os.path.abspath(source)
+		modified = os.path.getmtime(path)
+		if path not in _file_completers or _file_completers[path][0] != modified:
+			with open(path) as f:
+				_file_completers[path] = (modified, Completer(line.rstrip('\r\n') for line in f if line.strip()))
+		return _file_completers[path][1]
+	else:
+		return Completer(source)
+
+def _common_prefix_length(a, b):
+	length = min(len(a), len(b))
+	for i in range(length):
+		if a[i] != b[i]:
+			return i
+	return length
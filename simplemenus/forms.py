@@ -0,0 +1,192 @@
+"""
+Forms collect several typed values at once and return them as one record.
+
+Example:
+
+	person = get_form([('name', 'string'), ('age', 'integer', 18), ('birthday', 'date')])
+	print(person.name, person.age)
+
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+from __future__ import print_function
+import collections
+from . import main
+
+_FIELD_TYPES = {
+	'string': lambda value: value,
+	'integer': lambda value: main._to_integer(value),
+	'date': lambda value: main._to_date(value),
+	'boolean': lambda value: main._to_boolean(value),
+}
+
+_Field = collections.namedtuple('_Field', 'name convert default')
+_record_classes = {}
+
+def get_form(fields, text = '', delimiter = ','):
+	"""
+	Show all fields of a form, ask for their values and return them as a record.
+
+	The user either answers field by field or pastes all values as one delimited line
+	at the first field. A line only counts as pasted if it has a value for every field
+	and all of them are valid, otherwise it is the answer to the first field (i.e. a
+	name like "Doe, John"). All values are validated together, afterwards only the
+	invalid fields are asked again.
+
+	Example:
+
+		+--- Person ---+
+		a) name
+		b) age [18]
+		name> Mickey, 85
+
+	Args:
+		fields: a list of (name, type) or (name, type, default) tuples or an OrderedDict
+			that maps names to types. A type is 'string', 'integer', 'date', 'boolean' or a
+			function that converts a string and raises ValueError if it can't.
+		text: a headline for the form
+		delimiter: separates the values if they are entered as one line
+
+	Returns:
+		A namedtuple with one attribute per field
+	"""
+
+	fields = _normalize_fields(fields)
+	record_class = _record_class(fields)
+
+	if text:
+		main.show_small_headline(text)
+	main.show_enumerated_list([_field_label(field) for field in fields])
+
+	answers = [''] * len(fields)
+	pending = list(range(len(fields)))
+	while True:
+		for i in pending:
+			answer = main.get_string(fields[i].name)
+			if i == 0 and len(pending) == len(fields) and delimiter in answer:
+				pasted = _split_line(answer, delimiter)
+				if len(pasted) == len(fields):
+					values, errors = _convert(fields, pasted)
+					if not errors:
+						return record_class(*values)
+			answers[i] = answer
+
+		values, errors = _convert(fields, answers)
+		if not errors:
+			return record_class(*values)
+
+		for i, message in errors:
+			main._error("{}: {}".format(fields[i].name, message))
+		pending = [i for i, message in errors]
+
+def read_records(fields, stream, format = 'csv', delimiter = ','):
+	"""
+	Read many records without prompting, i.e. from a file or sys.stdin.
+
+	Args:
+		fields: see get_form()
+		stream: an iterable of lines
+		format: 'csv' for delimited lines (a header line with the field names gets
+			skipped) or 'jsonl' for one JSON object (or array) per line
+		delimiter: the csv delimiter
+
+	Returns:
+		A generator of namedtuples. Raises ValueError with the line number for invalid lines.
+	"""
+
+	fields = _normalize_fields(fields)
+	record_class = _record_class(fields)
+	names = [field.name for field in fields]
+
+	if format == 'csv':
+		import csv
+		rows = enumerate(csv.reader(stream, delimiter=delimiter), 1)
+	elif format == 'jsonl':
+		rows = ((number, _json_row(number, line, names)) for number, line in enumerate(stream, 1) if line.strip())
+	else:
+		raise ValueError("Unknown format: {}".format(format))
+
+	for number, row in rows:
+		if not row or (format == 'csv' and number == 1 and row == names):
+			continue
+		if len(row) != len(fields):
+			raise ValueError("Line {}: Expected {} values but got {}".format(number, len(fields), len(row)))
+
+		values, errors = _convert(fields, row)
+		if errors:
+			i, message = errors[0]
+			raise ValueError("Line {}: {}: {}".format(number, fields[i].name, message))
+
+		yield record_class(*values)
+
+def _normalize_fields(fields):
+	if isinstance(fields, dict):
+		fields = fields.items()
+
+	result = []
+	for field in fields:
+		name, kind = field[0], field[1]
+		default = field[2] if len(field) > 2 else None
+		convert = kind if callable(kind) else _FIELD_TYPES.get(kind)
+		if convert is None:
+			raise ValueError("Unknown field type: {}".format(kind))
+		result.append(_Field(name, convert, default))
+
+	return result
+
+def _record_class(fields):
+	names = tuple(field.name for field in fields)
+	if names not in _record_classes:
+		_record_classes[names] = collections.namedtuple('Record', names, rename=True)
+	return _record_classes[names]
+
+def _field_label(field):
+	if field.default is None:
+		return field.name
+	return "{} [{}]".format(field.name, field.default)
+
+def _split_line(line, delimiter):
+	import csv
+	return [value.strip() for value in next(csv.reader([line], delimiter=delimiter))]
+
+def _json_row(number, line, names):
+	import json
+	try:
+		data = json.loads(line)
+	except ValueError as e:
+		raise ValueError("Line {}: Not JSON: {}".format(number, e))
+
+	if isinstance(data, dict):
+		return [data.get(name) for name in names]
+	elif isinstance(data, list):
+		return data
+	raise ValueError("Line {}: Expected a JSON object or array".format(number))
+
+def _convert(fields, answers):
+	"""Convert all answers. Returns the values and a list of (index, message) for the invalid ones."""
+	values = []
+	errors = []
+	for i, (field, answer) in enumerate(zip(fields, answers)):
+		if (answer is None or answer == '') and field.default is not None:
+			values.append(field.default)
+		else:
+			try:
+				values.append(field.convert(_json_answer(answer)))
+			except ValueError as e:
+				values.append(None)
+				errors.append((i, str(e)))
+
+	return values, errors
+
+def _json_answer(answer):
+	"""Values of a JSON line as if they were typed, so they get converted and checked like answers."""
+	if answer is None:
+		return ''
+	elif answer is True or answer is False:
+		return 'y' if answer else 'n'
+	elif isinstance(answer, (int, float)):
+		return str(answer)
+	elif isinstance(answer, (list, dict)):
+		import json
+		raise ValueError("Not a single value: {}".format(json.dumps(answer)))
+	return answer
@@ -0,0 +1,149 @@
+"""
+Fuzzy ranking for search_from_list() and search_from_dictionary().
+
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import heapq
+import string
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+# One bit per letter and digit, all other characters share the remaining bits
+_BITS = dict((c, 1 << i) for i, c in enumerate(string.ascii_lowercase + string.digits))
+
+def _mask(text):
+	mask = 0
+	for c in set(text):
+		mask |= _BITS.get(c) or 1 << (36 + ord(c) % 28)
+	return mask
+
+class FuzzyIndex(object):
+	"""
+	Ranks candidates by how well a query matches them.
+
+	A query matches a candidate if its characters appear in the candidate in the same
+	order (case-insensitive), i.e. 'lbal' matches 'load-balancer'. Candidates that
+	contain the query as a whole come first, the earlier and the shorter the better.
+	The others follow, ranked by their length plus the characters between the first
+	and the last matched one, so short candidates with a tight match win.
+
+	Building the index lowercases all candidates once and keeps a bitmask of the
+	characters of each. A query only looks at candidates that contain all of its
+	characters, which is checked for all candidates at once with NumPy if it is
+	installed. With NumPy the matches are found and scored in bulk too, one pass
+	over the remaining candidates per character of the query. If a query extends the previous one only the previous matches are
+	looked at, so narrowing a search while typing gets faster with every character.
+	"""
+
+	def __init__(self, candidates):
+		self.candidates = list(candidates)
+		self._texts = [str(candidate).lower() for candidate in self.candidates]
+		masks = [_mask(text) for text in self._texts]
+		if numpy is not None:
+			self._masks = numpy.array(masks, dtype=numpy.uint64)
+			self._array = numpy.array(self._texts, dtype=str)
+			self._lengths = numpy.char.str_len(self._array)
+		else:
+			self._masks = masks
+		self._last_query = ''
+		self._last_matches = None
+
+	def __len__(self):
+		return len(self.candidates)
+
+	def rank(self, query, limit = None):
+		"""Returns the indices of the matching candidates, best match first.
+
+		Candidates must be shorter than a million characters for the scores to be exact.
+		"""
+		query = query.lower()
+		query_mask = _mask(query)
+
+		if self._last_query and query.startswith(self._last_query):
+			# typing on: only the candidates that matched the shorter query can match
+			possible = self._last_matches
+		elif numpy is not None:
+			mask = numpy.uint64(query_mask)
+			possible = numpy.flatnonzero((self._masks & mask) == mask)
+		else:
+			possible = [i for i, mask in enumerate(self._masks) if mask & query_mask == query_mask]
+
+		# Candidates that contain the whole query are found and scored in bulk,
+		# only the others are checked character by character.
+		if numpy is not None:
+			return self._rank_numpy(query, numpy.asarray(possible, dtype=numpy.intp), limit)
+
+		texts = self._texts
+		positions = [(texts[i].find(query), i) for i in possible]
+		scored = [((position << 40) | (len(texts[i]) << 20), i) for position, i in positions if position >= 0]
+		for position, i in positions:
+			if position < 0:
+				score = _score(query, texts[i])
+				if score is not None:
+					scored.append((score, i))
+
+		self._last_query = query
+		self._last_matches = [i for score, i in scored]
+
+		if limit is None:
+			scored.sort()
+		else:
+			scored = heapq.nsmallest(limit, scored)
+		return [i for score, i in scored]
+
+	def _rank_numpy(self, query, possible, limit):
+		positions = numpy.char.find(self._array[possible], query) if len(possible) else numpy.empty(0, dtype=numpy.int64)
+		whole = positions >= 0
+		scores = (positions[whole].astype(numpy.int64) << 40) | (self._lengths[possible[whole]].astype(numpy.int64) << 20)
+		indices = possible[whole]
+
+		partial = possible[~whole]
+		if len(partial):
+			partial_scores, matched = _score_numpy(query, self._array[partial], self._lengths[partial].astype(numpy.int64))
+			scores = numpy.concatenate([scores, partial_scores])
+			indices = numpy.concatenate([indices, partial[matched]])
+
+		self._last_query = query
+		self._last_matches = indices
+
+		if limit is not None and limit < len(scores):
+			# everything up to the limit-th score, including all ties, ordered like the pure Python version
+			top = numpy.flatnonzero(scores <= numpy.partition(scores, limit - 1)[limit - 1])
+		else:
+			top = numpy.arange(len(scores))
+		return indices[top[numpy.lexsort((indices[top], scores[top]))]][:limit].tolist()
+
+	def search(self, query, limit = None):
+		"""Like rank() but returns the candidates."""
+		return [self.candidates[i] for i in self.rank(query, limit)]
+
+def _score(query, text):
+	"""Scores a match that doesn't contain query as a whole. Smaller is better, None if query doesn't match text."""
+	first = position = text.find(query[0])
+	if first < 0:
+		# other characters share mask bits, so the mask lets some candidates through that don't match
+		return None
+	for c in query[1:]:
+		position = text.find(c, position + 1)
+		if position < 0:
+			return None
+
+	# (position << 40) | (length << 20) is the score of whole matches, this sorts after all of them
+	return ((len(text) + 1 + position - first + 1 - len(query)) << 40) | (first << 20) | len(text)
+
+def _score_numpy(query, texts, lengths):
+	"""_score() for an array of texts. Returns the scores of the matches and a boolean array of which texts match."""
+	first = position = numpy.char.find(texts, query[0]).astype(numpy.int64)
+	matched = first >= 0
+	for c in query[1:]:
+		# texts that didn't match search past their end, so they stay unmatched
+		position = numpy.char.find(texts, c, numpy.where(matched, position + 1, lengths + 1)).astype(numpy.int64)
+		matched &= position >= 0
+
+	first, position, lengths = first[matched], position[matched], lengths[matched]
+	scores = ((lengths + 1 + position - first + 1 - len(query)) << 40) | (first << 20) | lengths
+	return scores, matched
@@ -0,0 +1,193 @@
+"""
+Input history that is kept in a file across sessions. Used by the main module if
+configure('history_file', path) is set.
+
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import mmap
+import os
+import struct
+
+# Every record is written as
+#
+#	length (4 bytes) | key \0 value (utf-8) | previous (8 bytes) | length (4 bytes)
+#
+# where previous is the offset of the previous record with the same key. The
+# length at both ends allows walking the file forwards and backwards and the
+# previous offsets chain the records of one key, so recalling the entries of a
+# key never reads the entries of other keys once its newest record is found.
+#
+# A process that gets killed while it appends leaves a torn record at the end.
+# Readers ignore everything from there on, the next add() truncates it.
+_HEADER = struct.Struct('<I')
+_TRAILER = struct.Struct('<QI')
+_NONE = 0xffffffffffffffff
+
+class History(object):
+	"""
+	An append-only history file that is memory-mapped for reading.
+
+	Opening takes the same time no matter how large the file is, because nothing
+	gets read until a key is recalled. Several processes can share one file,
+	appending takes an exclusive file lock and looking for new records a shared
+	one, so no half written record gets read.
+	"""
+
+	def __init__(self, path):
+		self.path = path
+		self._file = open(path, 'a+b')
+		self._map = None
+		self._size = None
+		self._end = None # the end of the last complete record
+		self._heads = {} # key -> offset of its newest record
+		self._low = None # all records from this offset to the end are in _heads
+
+	def close(self):
+		if self._map is not None:
+			self._map.close()
+			self._map = None
+		self._file.close()
+
+	def add(self, key, value):
+		"""Append value to the history of key unless it is the newest entry already."""
+		payload = key.encode('utf-8') + b'\0' + value.encode('utf-8')
+
+		_lock(self._file)
+		try:
+			self._remap()
+			if self._end < self._size:
+				# a torn record, the next one would be appended to it
+				self._map.close()
+				self._map = None
+				self._file.truncate(self._end)
+				self._size = None
+				self._remap()
+
+			head = self._head(key)
+			if head is not None and self._read(head)[1] == value:
+				return
+
+			self._file.seek(0, os.SEEK_END)
+			self._file.write(_HEADER.pack(len(payload)) + payload + _TRAILER.pack(_NONE if head is None else head, len(payload)))
+			self._file.flush()
+		finally:
+			_unlock(self._file)
+
+	def recent(self, key, limit = None):
+		"""Returns the entries of key, newest first."""
+		self._refresh()
+		result = []
+		offset = self._head(key)
+		while offset is not None and (limit is None or len(result) < limit):
+			value, offset = self._read(offset)[1:]
+			result.append(value)
+		return result
+
+	def search(self, key, prefix):
+		"""Returns the newest entry of key that starts with prefix or None."""
+		self._refresh()
+		offset = self._head(key)
+		while offset is not None:
+			value, offset = self._read(offset)[1:]
+			if value.startswith(prefix):
+				return value
+		return None
+
+	def _refresh(self):
+		"""Map the file again if another process (or add()) made it grow."""
+		_lock(self._file, shared=True)
+		try:
+			self._remap()
+		finally:
+			_unlock(self._file)
+
+	def _remap(self):
+		"""_refresh() for callers that hold the lock."""
+		size = os.fstat(self._file.fileno()).st_size
+		if size == self._size:
+			return
+
+		if self._map is not None:
+			self._map.close()
+		self._map = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ) if size else None
+
+		if self._low is None:
+			# nothing is indexed at startup, _head() indexes backwards on demand
+			self._end = size if self._ends_complete(size) else self._scan(0, size)
+			self._low = self._end
+		else:
+			# records appended since the last refresh are newer than everything indexed so far
+			offset = self._end
+			end = self._next(offset, size)
+			while end is not None:
+				self._heads[self._read(offset)[0]] = offset
+				offset = end
+				end = self._next(offset, size)
+			self._end = offset
+		self._size = size
+
+	def _next(self, offset, size):
+		"""The offset after the record at offset or None if there is no complete record."""
+		if offset + _HEADER.size > size:
+			return None
+		length = _HEADER.unpack_from(self._map, offset)[0]
+		end = offset + _HEADER.size + length + _TRAILER.size
+		if end > size or _TRAILER.unpack_from(self._map, end - _TRAILER.size)[1] != length:
+			return None
+		return end
+
+	def _ends_complete(self, size):
+		"""True if the last record is complete, which is checked from the end without reading the file."""
+		if size == 0:
+			return True
+		if size < _HEADER.size + _TRAILER.size:
+			return False
+		length = _TRAILER.unpack_from(self._map, size - _TRAILER.size)[1]
+		offset = size - _TRAILER.size - length - _HEADER.size
+		return offset >= 0 and _HEADER.unpack_from(self._map, offset)[0] == length
+
+	def _scan(self, offset, size):
+		"""The end of the last complete record, found by reading forwards."""
+		end = self._next(offset, size)
+		while end is not None:
+			offset = end
+			end = self._next(offset, size)
+		return offset
+
+	def _head(self, key):
+		"""The offset of the newest record of key or None."""
+		while key not in self._heads and self._low > 0:
+			length = _TRAILER.unpack_from(self._map, self._low - _TRAILER.size)[1]
+			offset = self._low - _TRAILER.size - length - _HEADER.size
+			self._heads.setdefault(self._read(offset)[0], offset)
+			self._low = offset
+
+		return self._heads.get(key)
+
+	def _read(self, offset):
+		"""Returns key, value and the offset of the previous record with the same key."""
+		length = _HEADER.unpack_from(self._map, offset)[0]
+		start = offset + _HEADER.size
+		key, value = self._map[start:start + length].decode('utf-8').split('\0', 1)
+		previous = _TRAILER.unpack_from(self._map, start + length)[0]
+		return key, value, None if previous == _NONE else previous
+
+def _lock(f, shared = False):
+	try:
+		import fcntl
+		fcntl.flock(f.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+	except ImportError:
+		# msvcrt only has exclusive locks
+		import msvcrt
+		f.seek(0)
+		msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+def _unlock(f):
+	try:
+		import fcntl
+		fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+	except ImportError:
+		import msvcrt
+		f.seek(0)
+		msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,131 @@
+"""
+A journal of the answers of a session, so an interrupted session can be resumed.
+Used by the main module if configure('journal_file', path) is set.
+
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import json
+import os
+import threading
+
+class Journal(object):
+	"""
+	Every answer is appended to the file as one JSON line and flushed, so it survives
+	if the process gets killed (i.e. the ssh connection drops). fsync() is batched:
+	it runs after sync_every answers or on a timer sync_interval seconds after the
+	first answer that isn't synced yet, and on close(). That keeps answers safe
+	from most system crashes too without waiting for the disk after every key.
+
+	The answers of the previous session are loaded when the journal is opened and
+	can be handed out again with replay().
+
+	Menu actions are marked with {"action": label} when they start and {"done": label}
+	when they complete, so a resumed session can skip the actions that completed
+	together with the answers given to them (see skip_action()).
+	"""
+
+	def __init__(self, path, sync_every = 10, sync_interval = 1.0):
+		self.path = path
+		self.sync_every = sync_every
+		self.sync_interval = sync_interval
+		self.answers = []
+		self._position = 0
+		self._unsynced = 0
+		self._timer = None
+		self._lock = threading.Lock() # the timer syncs from its own thread
+
+		torn = False
+		if os.path.exists(path):
+			with open(path) as f:
+				for line in f:
+					try:
+						if not line.endswith("\n"):
+							raise ValueError()
+						self.answers.append(json.loads(line))
+					except ValueError:
+						torn = True # the last line of a killed process
+						break
+
+		self._file = open(path, 'a')
+		if torn:
+			# drop the torn line, the next answer would be appended to it
+			self._rewrite()
+
+	def close(self):
+		with self._lock:
+			if self._file is not None:
+				self._sync()
+				self._file.close()
+				self._file = None
+
+	def replaying(self):
+		"""True while answers of the previous session are left."""
+		return self._position < len(self.answers)
+
+	def replay(self):
+		"""The next answer of the previous session."""
+		answer = self.answers[self._position]
+		self._position += 1
+		return answer
+
+	def skip_action(self, label):
+		"""
+		Called while replaying where the action label starts. Returns True and skips its
+		answers if it completed in the previous session. Otherwise only its start is
+		replayed and the action has to run again.
+		"""
+		if self.answers[self._position] != {'action': label}:
+			return False # the session went differently, the answers tell
+
+		depth = 0
+		for i in range(self._position, len(self.answers)):
+			answer = self.answers[i]
+			if isinstance(answer, dict):
+				depth += 1 if 'action' in answer else -1
+				if depth == 0:
+					self._position = i + 1
+					return True
+
+		self._position += 1
+		return False
+
+	def append(self, answer):
+		with self._lock:
+			self._file.write(json.dumps(answer) + "\n")
+			self._file.flush()
+			self._unsynced += 1
+			if self._unsynced >= self.sync_every:
+				self._sync()
+			elif self._timer is None:
+				self._timer = threading.Timer(self.sync_interval, self.sync)
+				self._timer.daemon = True
+				self._timer.start()
+
+	def sync(self):
+		with self._lock:
+			self._sync()
+
+	def _sync(self):
+		if self._timer is not None:
+			self._timer.cancel()
+			self._timer = None
+		if self._unsynced and self._file is not None:
+			os.fsync(self._file.fileno())
+			self._unsynced = 0
+
+	def clear(self):
+		"""Forget all answers, i.e. when the session ended or shouldn't be resumed."""
+		del self.answers[:]
+		self._position = 0
+		self._rewrite()
+
+	def _rewrite(self):
+		with self._lock:
+			self._file.seek(0)
+			self._file.truncate()
+			for answer in self.answers:
+				self._file.write(json.dumps(answer) + "\n")
+			self._file.flush()
+			self._unsynced = len(self.answers)
+			self._sync()
@@ -5,11 +5,11 @@ Copyright (c) 2013, Jonas Pfannschmidt
 Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
 """
 from __future__ import print_function
-import datetime
-import string
-import types
+import itertools
 import sys
-from .xgetch import getch as _getch
+from .screen import Screen as _Screen
+from .selection import Selection as _Selection
+from .xgetch import KEY_UP, KEY_DOWN, KEY_HOME, KEY_END, KEY_PAGE_UP, KEY_PAGE_DOWN
 
 # Python 2.7 compatibility: Map input() to raw_input()
 try:
@@ -18,7 +18,17 @@ try:
 except (ImportError, AttributeError):
 	pass
 
+# Everything that takes noticeable time to import (terminal handling, dates,
+# history files, ...) is imported by the functions that need it.
+
+_LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+# pressed at the prompt of a list they switch to browsing with a cursor
+_NAVIGATION_KEYS = (KEY_UP, KEY_DOWN, KEY_HOME, KEY_END, KEY_PAGE_UP, KEY_PAGE_DOWN)
+
 _config = {}
+_screen = _Screen()
+
 def reset_config():
 	"""Resets the configuration to the default"""
 
@@ -30,6 +40,28 @@ def reset_config():
 	_config['empty_text'] = "No entries"
 	_config['date_format'] = '%d/%m/%Y'
 	_config['force_return'] = False
+	_config['page_size'] = 10
+	_config['cursor_marker'] = "->"
+	_config['redraw'] = False
+	_config['home_option'] = "^"
+	_config['home_text'] = "Home"
+	_config['forward_option'] = "+"
+	_config['forward_text'] = "Forward"
+	_config['breadcrumb_separator'] = " > "
+	_config['completion_limit'] = 100
+	_config['history_file'] = None
+	_config['history_length'] = 1000
+	_config['column_width'] = 30
+	_config['column_separator'] = "  "
+	_config['truncate_marker'] = "..."
+	_config['interactive'] = None
+	_config['protocol'] = False
+	_config['ranking'] = None
+	_config['ranking_file'] = None
+	_config['ranking_size'] = 3
+	_config['journal_file'] = None
+	_config['disabled_option'] = "-"
+	_screen.invalidate()
 
 reset_config()
 
@@ -46,6 +78,42 @@ def configure(key, value):
 			empty_text    - Text that gets displayed when a list is empty
 			date_format   - strptime format to parse dates. See docs.python.org/library/datetime.html#strftime-strptime-behavior
 			force_return  - Always confirm input by pressing the return key
+			page_size     - How many entries browse_list() shows at once
+			cursor_marker - Marks the highlighted entry in browse_list()
+			redraw        - Redraw menus and lists in place with ANSI escape sequences instead of
+			                printing them again. Only lines that changed get written.
+			home_option, home_text       - Go back to the root menu in start_menu_tree()
+			forward_option, forward_text - Return to the last submenu left in start_menu_tree()
+			breadcrumb_separator         - Separates the menu titles in the headline of a submenu
+			completion_limit - How many completions get_string() lists at most
+			history_file     - Keep the input of get_string(), get_integer() and get_date() in this
+			                   file. The previous answers to the same prompt can be recalled with
+			                   the up/down keys and searched with ctrl+r (needs readline) or
+			                   with !prefix, which answers the newest one that starts with prefix.
+			                   Answers that start with ! are typed as !!, i.e. !!important. Piped
+			                   input is always taken as it is.
+			history_length   - How many previous answers are recalled per prompt
+			column_width     - Longer cells get truncated in show_table() and get_from_table()
+			column_separator - Separates the columns of a table
+			truncate_marker  - Marks truncated cells
+			interactive      - True reads single keys from the terminal, False reads every answer
+			                   as a line, i.e. from a pipe. None checks once if stdin is a terminal.
+			protocol         - Talk JSON lines instead of showing menus, for programs that drive
+			                   the prompts. See _ask() for the messages. Progress and Spinner send
+			                   "progress" messages instead of drawing.
+			ranking          - Rank the entries of start_menu(), get_from_list() and get_from_dictionary()
+			                   by how often and how recently they were chosen. 'pin' shows the best
+			                   ones again on the hotkeys 1-9 above the list, 'sort' shows them first.
+			                   The letters of the entries stay the same. None turns ranking off.
+			ranking_file     - Keep the ranking in this file across sessions (None: this session only)
+			ranking_size     - How many entries get pinned or moved to the top (at most 9)
+			journal_file     - Write every answer to this file. If the program didn't end normally
+			                   (i.e. the ssh connection dropped) it offers to resume when it sets the
+			                   same journal_file again. Resuming runs the program with the previous
+			                   answers and without output until they run out. Menu actions that
+			                   completed are skipped, only the one that was interrupted runs again.
+			                   The file is emptied when the program ends normally.
+			disabled_option  - Shown instead of the option of a disabled MenuItem
 		value: The configuration value. See reset_config() for the defaults
 	"""
 
@@ -54,26 +122,57 @@ def configure(key, value):
 
 	_config[key] = value
 
+	if key == 'redraw':
+		_screen.invalidate()
+	elif key == 'journal_file' and value is not None:
+		# offer to resume before anything is shown
+		_journal()
+
 def wait_for_enter():
 	"""Waits for the user to press enter."""
-	input("Press enter to continue" + _config['prompt'])
+	if _config['protocol']:
+		_ask('enter', "Press enter to continue")
+		return
 
-def get_string(text = '', default = None):
-	"""Get string or default value."""
-	user_input = input(text + _config['prompt'])
+	_input("Press enter to continue" + _config['prompt'])
+
+def get_string(text = '', default = None, completion = None):
+	"""Get string or default value.
+
+	Args:
+		completion: Offer completions with the tab key. Either a Completer, a function that
+			returns the candidates for a prefix, the name of a file with one candidate per line
+			or a list of candidates. Build a Completer once for large lists. Trailing spaces
+			are removed from the input because readline adds one after a completion.
+	"""
+	if completion is not None:
+		from .completion import completer_for
+		completion = completer_for(completion)
+
+	if _config['protocol']:
+		user_input = _ask('string', text, default)
+	else:
+		user_input = _read_line(text, completion)
 
 	if _use_default(user_input, default):
 		return default
 	else:
+		_remember(text, user_input)
 		return user_input
 
 def get_character(text = '', default = None):
-	"""Get character without waiting for the enter key."""
-	sys.stdout.write(text + _config['prompt'])
+	"""Get character without waiting for the enter key.
 
-	user_input = _getch()
+	Cursor and paging keys are returned by name, i.e. KEY_UP or KEY_PAGE_DOWN.
 
-	sys.stdout.write(user_input + "\n")
+	If stdin is not a terminal a whole line is read and returned instead, an empty
+	line counts as the return key ('\\r') and the key names can be written out.
+	"""
+	if _config['protocol']:
+		user_input = _ask('character', text, default)
+	else:
+		sys.stdout.write(text + _config['prompt'])
+		user_input = _journaled(lambda: _echoed_key("{}\n"))
 
 	if _use_default(user_input, default):
 		return default
@@ -83,6 +182,10 @@ def get_character(text = '', default = None):
 def get_boolean(text = '', default = None):
 	"""Repeat until the user enters 'y' or 'n' or a string starting with 'y' or 'n' (i.e. 'yes' and 'no')."""
 
+	if _config['protocol'] or not _interactive():
+		# whole lines, so an empty line is the default and 'yes' works
+		return _get_converted(text, default, _to_boolean, 'boolean')
+
 	options = ['y', 'n']
 
 	if default is not None:
@@ -98,31 +201,47 @@ def get_boolean(text = '', default = None):
 		return False
 
 def get_integer(text = '', default = None):
-	"""Repeat until the user enters a valid number."""
+	"""Repeat until the user enters a valid whole number, i.e. 42, -7 or 1,500."""
 
-	user_input = input(text + _config['prompt'])
+	return _get_converted(text, default, _to_integer, 'integer')
 
-	if _use_default(user_input, default):
-		return default
-	elif user_input.isdigit():
-		return int(user_input)
-	else:
-		print("Not a number: {}".format(user_input))
-		return get_integer(text, default)
+def get_number(text = '', default = None, kind = int, units = None, minimum = None, maximum = None):
+	"""
+	Repeat until the user enters a valid number within minimum and maximum.
+
+	Accepts signs, thousands separators (1,500 or 1_500), fractions and exponents
+	and, if units are given, a suffix like 64k or 2h.
+
+	Args:
+		kind: int, float or decimal.Decimal
+		units: 'size' (k, m, g, t are powers of 1024, kb, mb, gb, tb powers of 1000),
+			'duration' (s, m, h, d, w, the result is in seconds) or a dict that maps
+			suffixes to factors
+		minimum, maximum: the allowed range, both inclusive
+	"""
+	from .numeric import parse_number
+	return _get_converted(text, default, lambda value: parse_number(value, kind, units, minimum, maximum), 'number')
+
+def get_range(text = '', default = None, kind = int, units = None, minimum = None, maximum = None):
+	"""
+	Like get_number() but for a range like 10-20 or 1k..4k. Returns a tuple (low, high),
+	a single number is returned as (number, number).
+	"""
+	from .numeric import parse_range
+	return _get_converted(text, default, lambda value: parse_range(value, kind, units, minimum, maximum), 'range')
+
+def get_numbers(text = '', default = None, kind = int, units = None, minimum = None, maximum = None):
+	"""
+	Like get_number() but for many numbers separated by whitespace, i.e. a pasted row
+	of a spreadsheet. Returns a list, an empty line without default gives [].
+	"""
+	from .numeric import parse_numbers
+	return _get_converted(text, default, lambda value: parse_numbers(value, kind, units, minimum, maximum), 'numbers')
 
 def get_date(text = '', default = None):
 	"""Repeat until the user enters a valid date."""
 
-	user_input = input(text + _config['prompt'])
-
-	if _use_default(user_input, default):
-		return default
-	else:
-		try:
-			return datetime.datetime.strptime(user_input, _config['date_format']).date()
-		except ValueError:
-			print("Not a date: {}".format(user_input))
-			return get_date(text, default)
+	return _get_converted(text, default, _to_date, 'date')
 
 def get_option(options, text = '', default = None):
 	"""Repeat until the user chooses a valid option.
@@ -133,17 +252,35 @@ def get_option(options, text = '', default = None):
 		options: a list of strings that are valid options
 	"""
 
-	if not _config['force_return'] and not [x for x in options if len(x) > 1]:
-		# if all options are only one character, we can use get_character instead of get_string
-		user_input = get_character(text, default)
-	else:
-		user_input = get_string(text, default)
-	
-	if user_input in options or user_input == default:
-		return user_input
-	else:
-		print("Must be one of: {}".format(options))
-		return get_option(options, text)
+	return _get_option(options, text, default)
+
+def _get_option(options, text, default, prompt_type = 'option', labels = None, keys = (), **details):
+	"""
+	get_option() that describes itself as prompt_type with labelled options in protocol
+	mode. keys are named keys that are returned too, without being options.
+	"""
+	while True:
+		if _config['protocol']:
+			user_input = _ask(prompt_type, text, default, labels or _labelled(options, options), **details)
+			if _use_default(user_input, default):
+				user_input = default
+		elif not _config['force_return'] and _interactive() and not any(len(x) > 1 for x in options):
+			# if all options are only one character, we can use get_character instead of get_string
+			user_input = get_character(text, default)
+		elif keys and not _config['force_return'] and _interactive():
+			# read key by key, so the named keys still work before anything is typed
+			sys.stdout.write(text + _config['prompt'])
+			user_input = _journaled(lambda: _read_option(keys))
+			if _use_default(user_input, default):
+				user_input = default
+		else:
+			user_input = get_string(text, default)
+
+		if user_input in options or user_input == default or user_input in keys:
+			return user_input
+
+		_error("Must be one of: {}".format(options))
+		default = None
 
 def get_from_list(my_list, text = '', show_cancel = True, default = None):
 	"""
@@ -159,43 +296,314 @@ def get_from_list(my_list, text = '', show_cancel = True, default = None):
 		0) Cancel
 		>
 
+	my_list can also be a simplemenus.model.Menu, then the value of the chosen item is returned.
+
+	The cursor and paging keys switch to browsing the list like browse_list(), the
+	options stay the same.
+	"""
+
+	return _value(_choose_from_list(my_list, text, show_cancel, default))
+
+def get_from_dictionary(dictionary, text = '', show_cancel = True):
+	"""Let the user choose a key and return the corresponding value.
+
+	Note: Use OrderedDict to preserve the option order or a simplemenus.model.Menu
 	"""
 
-	options = _enumerate_list(my_list)
-	show_enumerated_list(my_list)
+	return _choose_from_dictionary(dictionary, text, show_cancel)
 
+def _choose_from_dictionary(dictionary, text, show_cancel, headline = None):
+	from .model import Menu
+	if isinstance(dictionary, Menu):
+		return _value(_choose_from_list(dictionary, text, show_cancel, None, headline))
+
+	key = _choose_from_list(list(dictionary.keys()), text, show_cancel, None, headline)
+
+	return dictionary[key] if key else key
+
+def _choose_from_list(my_list, text, show_cancel, default, headline = None):
+	"""get_from_list() with an optional headline that is part of the same (re)drawn frame. Returns the MenuItem for a Menu."""
+
+	from .model import Menu
+	if isinstance(my_list, Menu):
+		# everything is precomputed
+		entries, texts, lines, positions = my_list.items, my_list.texts, my_list.lines(), my_list.positions
+		options = list(my_list.options)
+		labels = my_list.labels
+	else:
+		entries, texts, lines, positions = my_list, my_list, None, None
+		options = _enumerate_list(my_list)
+		labels = my_list
+
+	key = text if headline is None else headline
+	ranked = _ranked(key, labels)
+	if positions is not None:
+		ranked = [i for i in ranked if entries[i].enabled]
+	hotkeys = _hotkeys(len(ranked), options) if _config['ranking'] == 'pin' else []
+
+	options.extend(hotkeys)
 	if show_cancel:
-		print("")
 		options.append(_config['cancel_option'])
-		print(_config['list_format'].format(option=_config['cancel_option'], text=_config['cancel_text']))
 
-	chosen = get_option(options, text, default=default)
+	if _config['protocol']:
+		if positions is None:
+			option_texts = [str(value) for value in texts]
+		else:
+			option_texts = [str(texts[positions[option]]) for option in my_list.options]
+		option_texts += [str(texts[i]) for i in ranked[:len(hotkeys)]]
+		labels = _labelled(options, option_texts + [_config['cancel_text']])
+		if headline is None:
+			chosen = _get_option(options, text, default, 'list', labels)
+		else:
+			chosen = _get_option(options, text, default, 'menu', labels, headline=headline)
+	else:
+		frame = _list_lines(texts, show_cancel, ranked, hotkeys, lines)
+		if headline is not None:
+			frame = _headline_lines(headline) + frame
+		_show_frame(frame)
+
+		chosen = _get_option(options, text, default, keys=_NAVIGATION_KEYS if entries else ())
+		if chosen in _NAVIGATION_KEYS:
+			if positions is None:
+				lines, entry_option = _enumerated_lines(texts), _number_to_letter
+			else:
+				entry_option = lambda i: my_list.keys[i] if entries[i].enabled else None
+			# the cursor starts above the list, so down highlights the first entry
+			cursor = _move_cursor(chosen, -1, len(entries))
+			chosen = _browse(len(entries), lines.__getitem__, entry_option, set(options).__contains__, text, show_cancel, headline, cursor)
 
 	if chosen == default:
 		return default
 	elif chosen == _config['cancel_option']:
 		None
 	else:
-		return my_list[_letter_to_number(chosen)]
+		if chosen in hotkeys:
+			i = ranked[hotkeys.index(chosen)]
+		else:
+			i = _letter_to_number(chosen) if positions is None else positions[chosen]
+		if _config['ranking'] is not None:
+			_ranking().choose(key, str(labels[i]))
+		return entries[i]
 
-def get_from_dictionary(dictionary, text = '', show_cancel = True):
-	"""Let the user choose a key and return the corresponding value.
+def _value(chosen):
+	"""The value of a chosen MenuItem, anything else as it is."""
+	from .model import MenuItem
+	return chosen.value if isinstance(chosen, MenuItem) else chosen
 
-	Note: Use OrderedDict to preserve the option order
+def search_from_list(my_list, text = '', show_cancel = True, limit = None):
 	"""
+	Lets the user search a long list and choose one of the best matches.
 
-	key = get_from_list(list(dictionary.keys()), text = text, show_cancel=show_cancel)
+	The user enters a search (i.e. 'lbal' finds 'load-balancer'), then chooses from the
+	best matches like with get_from_list(). Canceling the choice asks for a new search,
+	an empty search cancels.
+
+	Args:
+		my_list: a list or a simplemenus.fuzzy.FuzzyIndex. Build the index once to search
+			a long list more than once.
+		limit: how many matches are shown at most (default: configure('page_size'))
+
+	Returns:
+		The chosen value or None when canceled
+	"""
+	from .fuzzy import FuzzyIndex
+	index = my_list if isinstance(my_list, FuzzyIndex) else FuzzyIndex(my_list)
+
+	while True:
+		query = get_string(text)
+		if not query:
+			return None
+
+		matches = index.search(query, limit or _config['page_size'])
+		if not matches:
+			_print_lines([_config['empty_text']])
+			continue
+
+		chosen = get_from_list(matches, show_cancel=show_cancel)
+		if chosen is not None:
+			return chosen
+
+def search_from_dictionary(dictionary, text = '', show_cancel = True, limit = None):
+	"""Like search_from_list() but searches the keys and returns the corresponding value."""
+
+	key = search_from_list(list(dictionary.keys()), text, show_cancel, limit)
 
 	return dictionary[key] if key else key
 
+def browse_list(my_list, text = '', show_cancel = True):
+	"""
+	Lets the user choose one value with the cursor keys. Useful for long lists.
+
+	Shows one page of the list at a time. Up/down move the cursor, page up/page down
+	and home/end jump, return chooses the highlighted entry. Typing the option of
+	an entry chooses it directly. The options are the same on every page, like in
+	get_from_list().
+
+	Example:
+
+		   a) one
+		-> b) two
+		   c) three
+		(1-3 of 40)
+
+		   0) Cancel
+		>
+
+	"""
+
+	if not my_list:
+		_print_lines([_config['empty_text']])
+		return None
+
+	if _config['protocol']:
+		# a program has no use for the cursor, it chooses like from get_from_list()
+		return _choose_from_list(my_list, text, show_cancel, None)
+
+	def entry_line(i):
+		return _config['list_format'].format(option=_number_to_letter(i), text=my_list[i])
+
+	def is_option(option):
+		if show_cancel and option == _config['cancel_option']:
+			return True
+		try:
+			return _option_to_index(option, len(my_list)) is not None
+		except ValueError:
+			return False
+
+	chosen = _browse(len(my_list), entry_line, _number_to_letter, is_option, text, show_cancel, None, 0)
+	if show_cancel and chosen == _config['cancel_option']:
+		return None
+	return my_list[_letter_to_number(chosen)]
+
+def get_many_from_list(my_list, text = '', show_cancel = True, indices = False):
+	"""
+	Enumerates a list and lets the user choose any number of values.
+
+	The user enters commands until an empty line finishes the selection:
+
+		b        toggles one entry
+		a-k      selects a range of entries
+		*        selects all entries
+		/text    selects all entries that contain text (case-insensitive)
+		!...     deselects instead, i.e. !a-k, !* or !/text
+		?        shows the selected entries
+
+	Several commands can be entered at once, separated by spaces or commas.
+
+	Args:
+		indices: Return the indices of the chosen values instead of the values
+
+	Returns:
+		A list of the chosen values (or indices) in list order or None when canceled
+
+	In protocol mode the answer can also be a list of options, which chooses
+	exactly these entries.
+	"""
+
+	if _config['protocol']:
+		options = _enumerate_list(my_list) + ([_config['cancel_option']] if show_cancel else [])
+		labels = _labelled(options, [str(value) for value in my_list] + [_config['cancel_text']])
+	else:
+		show_enumerated_list(my_list)
+		if show_cancel:
+			print("")
+			print(_config['list_format'].format(option=_config['cancel_option'], text=_config['cancel_text']))
+
+	selection = _Selection(len(my_list))
+	while True:
+		if _config['protocol']:
+			user_input = _ask('many', text, None, labels)
+			if isinstance(user_input, list):
+				try:
+					chosen = [_option_to_index(option, len(my_list)) for option in user_input]
+				except (TypeError, ValueError) as e:
+					_error(str(e))
+					continue
+				selection = _Selection(len(my_list))
+				for i in chosen:
+					selection.set_range(i, i + 1, True)
+				break
+		else:
+			user_input = get_string(text)
+		user_input = user_input.strip()
+
+		if not user_input:
+			break
+		elif show_cancel and user_input == _config['cancel_option']:
+			return None
+		elif user_input == '?':
+			show_enumerated_list([my_list[i] for i in selection])
+			continue
+
+		try:
+			for command in user_input.replace(',', ' ').split():
+				_apply_selection_command(command, my_list, selection)
+		except ValueError as e:
+			_error(str(e))
+
+		_print_lines(["{} selected".format(len(selection))])
+
+	return list(selection) if indices else [my_list[i] for i in selection]
+
 def show_enumerated_list(my_list):
 	"""Shows a list enumerated by a, b, c, ..."""
 
-	if (my_list):
-		for option, value in zip(_enumerate_list(my_list), my_list):
-		     print(_config['list_format'].format(option=option, text=value)	)
+	_print_lines(_enumerated_lines(my_list))
+
+def show_table(rows, headers = None, start = 0, count = None, sample = 1000):
+	"""
+	Shows rows of records as an enumerated table. Only the rows from start to
+	start + count get formatted, so a page of a huge table is shown as quickly
+	as a small table.
+
+	Example:
+
+		   host   status  load
+		a) web-1  up      0.25
+		b) db-1   down    0.00
+
+	Args:
+		rows: a list of sequences or dicts
+		headers: the column titles. Required for dicts, they are used as the keys.
+		start, count: which rows to show (default: all)
+		sample: the column widths are computed from this many rows (all if None)
+	"""
+	_print_lines(_table_lines(rows, headers, start, count, sample))
+
+def get_from_table(rows, headers = None, text = '', show_cancel = True, default = None, start = 0, count = None, sample = 1000):
+	"""
+	Shows a table like show_table() and lets the user choose one row.
+
+	Options stay the same on every page, i.e. the first row on the second
+	page of ten is always k.
+
+	Returns:
+		The chosen row, default or None when canceled
+	"""
+	stop = len(rows) if count is None else min(start + count, len(rows))
+	options = [_number_to_letter(i) for i in range(start, stop)]
+	if show_cancel:
+		options.append(_config['cancel_option'])
+
+	if _config['protocol']:
+		# the rows are sent as they are, not formatted
+		labels = _labelled(options, [rows[i] for i in range(start, stop)] + [_config['cancel_text']])
+		chosen = _get_option(options, text, default, 'table', labels, headers=headers)
+	else:
+		lines = _table_lines(rows, headers, start, count, sample)
+		if show_cancel:
+			lines.append("")
+			lines.append(_config['list_format'].format(option=_config['cancel_option'], text=_config['cancel_text']))
+
+		_show_frame(lines)
+		chosen = get_option(options, text, default=default)
+
+	if chosen == default:
+		return default
+	elif chosen == _config['cancel_option']:
+		return None
 	else:
-		print(_config['empty_text'])
+		return rows[_letter_to_number(chosen)]
 
 def show_headline(headline):
 	""" Show a headline.
@@ -208,12 +616,7 @@ def show_headline(headline):
 
 	"""
 
-	line = "+" + "-" * (len(headline) + 2) + "+"
-	print("")
-	print(line)
-	print("| " + headline + " |")
-	print(line)
-	print("")
+	_print_lines(_headline_lines(headline))
 
 def show_small_headline(headline):
 	""" Show a smaller headline.
@@ -222,48 +625,711 @@ def show_small_headline(headline):
 		+-- Test --+
 	"""
 
-	print("+--- " + headline + " ---+")
+	_print_lines(["+--- " + headline + " ---+"])
+
+def invalidate_screen():
+	"""
+	With configure('redraw', True): repaint everything on the next draw instead of
+	only the lines that changed. Call it if something moved the frame, i.e. output
+	that scrolled the terminal.
+	"""
+	_screen.invalidate()
 
 def start_menu(menu, headline, repeat=True, show_cancel=True, args=[], kwargs={}):
 	"""Show a menu and run a function if the user chooses one menu entry.
 
 	Args:
-		menu: an OrderedDict dictionary. The keys are shown as menu entries. If a value is a functions 
-			  it gets called when the user chooses the corresponding menu entry otherwise it gets returned.
+		menu: an OrderedDict dictionary or a simplemenus.model.Menu. The keys are shown as menu entries. If a value is callable
+			  (a function, method, functools.partial, builtin or an object with __call__) it gets called
+			  when the user chooses the corresponding menu entry otherwise it gets returned. Coroutine
+			  functions are run until they complete. Classes are returned, not instantiated.
 		headline: the title for the menu
 		repeat: Whether to show the menu again until the user chooses cancel
 		show_cancel: Whether to show the cancel option
 		args: a list of arguments that get passed to a chosen function
 		kwargs: a dict of keyword arguments that get passed to a chosen function
+
+	With configure('redraw', True) the menu stays at the top of the terminal and gets
+	updated in place instead of being printed again after every action. If an action
+	writes output the user presses a key before the menu is drawn over it.
+
+	The cursor and paging keys browse the entries like in get_from_list().
 	"""
-	show_headline(headline)
+	from .model import Menu
+	if isinstance(menu, Menu):
+		return _start_menu(menu, headline, repeat, show_cancel, args, kwargs)
+
+	actions = {}
+	while True:
+		key = _choose_from_list(list(menu.keys()), '', show_cancel, None, headline)
+		chosen = menu[key] if key else key
+
+		# resolve each entry only once, unless its value gets replaced
+		if key not in actions or actions[key][0] is not chosen:
+			actions[key] = (chosen, _resolve_action(chosen))
+		action = actions[key][1]
+
+		if action is None:
+			return chosen
+
+		_run_action(action, key, args, kwargs)
+
+		if not repeat:
+			return chosen
+
+def _start_menu(menu, headline, repeat, show_cancel, args, kwargs):
+	"""start_menu() for a Menu, whose items know their actions already."""
+	while True:
+		item = _choose_from_list(menu, '', show_cancel, None, headline)
+		if item is None:
+			return None
+		if item.action is None:
+			return item.value
+
+		_run_action(item.action, item.label, args, kwargs)
 
-	if repeat:
-		chosen = get_from_dictionary(menu, show_cancel=show_cancel)
-		while isinstance(chosen, types.FunctionType):
-			chosen(*args, **kwargs)
-			show_headline(headline)
-			chosen = get_from_dictionary(menu)
+		if not repeat:
+			return item.value
+
+def _run_action(action, label, args, kwargs):
+	"""Calls a menu action. A resumed session skips the actions that completed before it was interrupted."""
+	journal = _journal()
+	if journal is None:
+		_call_action(action, args, kwargs)
+		return
+
+	label = str(label)
+	if journal.replaying():
+		if journal.skip_action(label):
+			return
 	else:
-		chosen = get_from_dictionary(menu, show_cancel=show_cancel)
-		if isinstance(chosen, types.FunctionType):
-			chosen(*args, **kwargs)
+		journal.append({'action': label})
+
+	_call_action(action, args, kwargs)
+
+	if not journal.replaying():
+		journal.append({'done': label})
+
+def _call_action(action, args, kwargs):
+	"""
+	Calls action. In redraw mode the next frame would clear the output of the action
+	right away, so if it wrote something the user gets to read it first.
+	"""
+	journal = _journal()
+	if not _config['redraw'] or _config['protocol'] or not _interactive() or (journal is not None and journal.replaying()):
+		action(*args, **kwargs)
+		return
+
+	watch = sys.stdout = _OutputWatch(sys.stdout)
+	try:
+		action(*args, **kwargs)
+	finally:
+		if sys.stdout is watch:
+			sys.stdout = watch.stream
 
-	return chosen
+	if watch.written:
+		# a pause, not an answer, so it isn't journaled
+		sys.stdout.write("Press any key to continue")
+		sys.stdout.flush()
+		_getkey()
+		sys.stdout.write("\n")
+
+class _OutputWatch(object):
+	"""Takes the place of sys.stdout while an action runs in redraw mode and notes if anything was written."""
+	def __init__(self, stream):
+		self.stream = stream
+		self.written = False
+
+	def write(self, text):
+		if text:
+			self.written = True
+		self.stream.write(text)
+
+	def flush(self):
+		self.stream.flush()
+
+	def __getattr__(self, name):
+		return getattr(self.stream, name)
+
+def _resolve_action(value):
+	"""Returns a function that runs value or None if value isn't an action."""
+	if isinstance(value, type) or not callable(value):
+		return None
+
+	def run(*args, **kwargs):
+		result = value(*args, **kwargs)
+		if _isawaitable(result):
+			result = _run_coroutine(result)
+		return result
+
+	return run
+
+def _isawaitable(value):
+	try:
+		import inspect
+		return inspect.isawaitable(value)
+	except AttributeError: # Python 2 has no coroutines
+		return False
+
+def _run_coroutine(coroutine):
+	"""Run a coroutine to completion, on a worker thread if an event loop is already running here."""
+	import asyncio
+	try:
+		asyncio.get_running_loop()
+	except RuntimeError:
+		return asyncio.run(coroutine)
+
+	import concurrent.futures
+	with concurrent.futures.ThreadPoolExecutor(1) as executor:
+		return executor.submit(asyncio.run, coroutine).result()
 
 def _number_to_letter(i):
 	l = i % 26
 	n = int(i / 26) + 1
 
-	return n * string.ascii_letters[:26][l]
+	return n * _LETTERS[l]
 
 def _letter_to_number(l):
-	i = string.ascii_letters[:26].index(l[0])
+	i = _LETTERS.index(l[0])
 
 	return i + ((len(l) - 1) * 26)
 
 def _enumerate_list(my_list):
 	return [_number_to_letter(i) for i, x in enumerate(my_list)]
 
+def _option_to_index(option, length):
+	"""Like _letter_to_number() but raises ValueError for anything that is not a valid option."""
+	if option and option[0] in _LETTERS:
+		i = _letter_to_number(option)
+		if i < length and _number_to_letter(i) == option:
+			return i
+
+	raise ValueError("Not an option: {}".format(option))
+
+def _apply_selection_command(command, my_list, selection):
+	selected = not command.startswith('!')
+	if not selected:
+		command = command[1:]
+
+	if command == '*':
+		selection.set_range(0, len(my_list), selected)
+	elif command.startswith('/'):
+		pattern = command[1:].lower()
+		for i, value in enumerate(my_list):
+			if pattern in str(value).lower():
+				selection.set_range(i, i + 1, selected)
+	elif '-' in command:
+		first, last = command.split('-', 1)
+		first, last = _option_to_index(first, len(my_list)), _option_to_index(last, len(my_list))
+		selection.set_range(min(first, last), max(first, last) + 1, selected)
+	elif selected:
+		selection.toggle(_option_to_index(command, len(my_list)))
+	else:
+		selection.discard(_option_to_index(command, len(my_list)))
+
+def _show_frame(lines):
+	"""Print the lines or redraw them in place if configured. The prompt describes itself in protocol mode."""
+	if _config['protocol']:
+		pass
+	elif _config['redraw']:
+		_screen.draw(lines)
+	elif lines:
+		# one write instead of one print per line, this adds up for huge menus
+		sys.stdout.write("\n".join(lines) + "\n")
+
+def _headline_lines(headline):
+	from .width import display_width
+	line = "+" + "-" * (display_width(headline) + 2) + "+"
+	return ["", line, "| " + headline + " |", line, ""]
+
+def _enumerated_lines(my_list):
+	if not my_list:
+		return [_config['empty_text']]
+
+	return [_config['list_format'].format(option=option, text=value) for option, value in zip(_enumerate_list(my_list), my_list)]
+
+def _list_lines(my_list, show_cancel, ranked = (), hotkeys = (), entry_lines = None):
+	"""
+	ranked are the indices of the most used entries. They are shown again on the hotkeys
+	or, without hotkeys, first. entry_lines are the precomputed lines of a Menu.
+	"""
+	entry_lines = _enumerated_lines(my_list) if entry_lines is None else entry_lines
+	if hotkeys:
+		lines = [_config['list_format'].format(option=hotkey, text=my_list[i]) for hotkey, i in zip(hotkeys, ranked)]
+		lines.append("")
+		lines.extend(entry_lines)
+	elif ranked:
+		first = set(ranked)
+		order = list(ranked) + [i for i in range(len(my_list)) if i not in first]
+		lines = [entry_lines[i] for i in order]
+	else:
+		lines = list(entry_lines)
+
+	if show_cancel:
+		lines.append("")
+		lines.append(_config['list_format'].format(option=_config['cancel_option'], text=_config['cancel_text']))
+
+	return lines
+
+def _table_lines(rows, headers, start, count, sample):
+	if not rows:
+		return [_config['empty_text']]
+
+	stop = len(rows) if count is None else min(start + count, len(rows))
+	cells = lambda row: [row[key] for key in headers] if isinstance(row, dict) else row
+
+	# widths in one pass over a sample, the cells of the shown rows only get formatted once
+	from .width import display_width, ljust, truncate
+
+	widths = [display_width(str(header)) for header in headers] if headers else []
+	for row in itertools.islice(rows, 0, sample):
+		for column, cell in enumerate(cells(row)):
+			if column < len(widths):
+				widths[column] = max(widths[column], display_width(str(cell)))
+			else:
+				widths.append(display_width(str(cell)))
+	widths = [min(width, _config['column_width']) for width in widths]
+
+	def format_cells(values):
+		return _config['column_separator'].join(ljust(truncate(str(value), width, _config['truncate_marker']), width) for value, width in zip(values, widths)).rstrip()
+
+	# options get longer further down (z, aa, ...), the widest one on the page sets where the cells start
+	options = [_number_to_letter(i) for i in range(start, stop)]
+	option_width = max(len(option) for option in options) if options else 0
+
+	lines = []
+	if headers:
+		indent = display_width(_config['list_format'].format(option=" " * option_width, text=''))
+		lines.append(" " * indent + format_cells(headers))
+	for i, option in zip(range(start, stop), options):
+		padding = " " * (option_width - len(option))
+		lines.append(_config['list_format'].format(option=option, text=padding + format_cells(cells(rows[i]))))
+
+	return lines
+
+def _browse(length, entry_line, entry_option, is_option, text, show_cancel, headline, cursor):
+	"""
+	Shows the page of the entries around the cursor and moves it until an entry is chosen.
+
+	entry_line(i) is the line of an entry with its option, entry_option(i) the option that
+	return chooses (None for disabled entries) and is_option(typed) checks typed options.
+	Options are typed as in get_option(): one key if all are single letters, otherwise a
+	line, which only starts moving the cursor if a cursor key comes before anything typed.
+	"""
+	from .width import display_width
+	blank = " " * display_width(_config['cursor_marker'])
+	single_keys = length <= len(_LETTERS) and (not show_cancel or len(_config['cancel_option']) == 1)
+
+	while True:
+		first = cursor - cursor % _config['page_size']
+		stop = min(first + _config['page_size'], length)
+		lines = [(_config['cursor_marker'] if i == cursor else blank) + " " + entry_line(i) for i in range(first, stop)]
+		if stop - first < length:
+			lines.append("({}-{} of {})".format(first + 1, stop, length))
+		if show_cancel:
+			lines.append("")
+			lines.append(blank + " " + _config['list_format'].format(option=_config['cancel_option'], text=_config['cancel_text']))
+		if headline is not None:
+			lines = _headline_lines(headline) + lines
+		_show_frame(lines)
+
+		sys.stdout.write(text + _config['prompt'])
+		if single_keys or not _interactive():
+			key = _journaled(lambda: _echoed_key("\n"))
+		else:
+			key = _journaled(lambda: _read_option(_NAVIGATION_KEYS)) or '\r'
+
+		if key in ('\r', '\n'):
+			if entry_option(cursor) is not None:
+				return entry_option(cursor)
+		elif is_option(key):
+			return key
+
+		cursor = _move_cursor(key, cursor, length)
+
+def _move_cursor(key, cursor, length):
+	if key == KEY_UP:
+		cursor -= 1
+	elif key == KEY_DOWN:
+		cursor += 1
+	elif key == KEY_PAGE_UP:
+		cursor -= _config['page_size']
+	elif key == KEY_PAGE_DOWN:
+		cursor += _config['page_size']
+	elif key == KEY_HOME:
+		cursor = 0
+	elif key == KEY_END:
+		cursor = length - 1
+
+	return min(max(cursor, 0), length - 1)
+
+def _get_converted(text, default, convert, prompt_type = 'string'):
+	"""Repeat until convert() accepts the input. convert() raises ValueError with a message for the user."""
+	while True:
+		if _config['protocol']:
+			user_input = _ask(prompt_type, text, default)
+		else:
+			user_input = _read_line(text)
+
+		if _use_default(user_input, default):
+			return default
+
+		try:
+			value = convert(user_input)
+		except ValueError as e:
+			_error(str(e))
+			continue
+
+		_remember(text, user_input)
+		return value
+
+def _to_integer(value):
+	if value.isdigit():
+		return int(value)
+
+	from .numeric import parse_number
+	return parse_number(value)
+
+def _to_date(value):
+	import datetime
+	try:
+		return datetime.datetime.strptime(value, _config['date_format']).date()
+	except ValueError:
+		raise ValueError("Not a date: {}".format(value))
+
+def _to_boolean(value):
+	if value[:1].lower() == 'y':
+		return True
+	elif value[:1].lower() == 'n':
+		return False
+	raise ValueError("Not yes or no: {}".format(value))
+
+def _read_line(text, completer = None):
+	"""
+	input() for all prompts that read a line. Adds tab completion if there is a
+	completer and the history of the prompt if configure('history_file') is set.
+	Both need readline for the editing keys. Without readline (or if the terminal
+	passes the tab through) an input ending with a tab lists the candidates and
+	asks again. With a history an input of !prefix recalls the newest previous
+	answer that starts with prefix, like in bash. It searches the whole history,
+	not only the answers readline was given. !! escapes a leading !. Both only
+	apply to a terminal, a script's answers are never replaced.
+	"""
+	history = _history()
+	readline = _import_readline() if (completer or history) and _interactive() else None
+
+	if readline and completer:
+		matches = []
+		def complete(prefix, state):
+			if state == 0:
+				matches[:] = completer.candidates(prefix, _config['completion_limit'])
+				if len(matches) == _config['completion_limit']:
+					# readline inserts the common prefix of the matches, so add the real one
+					matches.insert(0, completer.complete(prefix))
+			return matches[state] if state < len(matches) else None
+
+		old_completer = readline.get_completer()
+		old_delimiters = readline.get_completer_delims()
+		readline.set_completer(complete)
+		readline.set_completer_delims('')
+		readline.parse_and_bind('tab: complete')
+
+	if readline and history:
+		# show only the history of this prompt, newest last
+		old_history = [readline.get_history_item(i) for i in range(1, readline.get_current_history_length() + 1)]
+		readline.clear_history()
+		for entry in reversed(history.recent(text, _config['history_length'])):
+			readline.add_history(entry)
+
+	try:
+		while True:
+			user_input = _input(text + _config['prompt'])
+			if completer is not None and user_input.endswith('\t'):
+				for candidate in completer.candidates(user_input.rstrip('\t'), _config['completion_limit']):
+					print(candidate)
+			elif history and _interactive() and user_input.startswith('!!'):
+				user_input = user_input[1:]
+				break
+			elif history and _interactive() and len(user_input) > 1 and user_input.startswith('!'):
+				found = history.search(text, user_input[1:])
+				if found is None:
+					print("No previous answer starts with: {}".format(user_input[1:]))
+				else:
+					print(found)
+					user_input = found
+					break
+			else:
+				break
+	finally:
+		if readline and completer:
+			readline.set_completer(old_completer)
+			readline.set_completer_delims(old_delimiters)
+		if readline and history:
+			readline.clear_history()
+			for entry in old_history:
+				readline.add_history(entry)
+
+	if readline and completer:
+		# readline adds a space after a unique completion
+		user_input = user_input.rstrip(' ')
+
+	return user_input
+
+def _ask(prompt_type, text, default = None, options = None, **details):
+	"""
+	Protocol mode: writes the prompt as one JSON object on one line and reads the
+	answer as one JSON value from the next line, i.e.
+
+		{"type": "list", "text": "", "options": [{"option": "a", "text": "one"}, ...], "default": null}
+		"a"
+
+	type is one of string, character, boolean, integer, number, range, numbers, date, option,
+	list, menu (with the headline), table (with the headers, the rows are the option
+	texts), many or enter. Invalid answers are reported as {"type": "error", "message": ...}
+	and the prompt is sent again.
+
+	null is returned as '' (the default), true and false as 'y' and 'n' and numbers
+	as strings, so the answer gets checked like typed input.
+	"""
+	import json
+	message = {'type': prompt_type, 'text': text, 'options': options, 'default': default}
+	message.update(details)
+
+	while True:
+		_emit(message)
+		line = _journaled(_next_line)
+		try:
+			answer = json.loads(line)
+		except ValueError:
+			_error("Not JSON: {}".format(line))
+			continue
+
+		if answer is None:
+			return ''
+		elif answer is True or answer is False:
+			return 'y' if answer else 'n'
+		elif isinstance(answer, (int, float)):
+			return str(answer)
+		elif isinstance(answer, dict) or (isinstance(answer, list) and prompt_type != 'many'):
+			_error("Not a valid answer: {}".format(line))
+			continue
+		return answer
+
+def _emit(message):
+	import json
+	sys.stdout.write(json.dumps(message, default=str) + "\n")
+	sys.stdout.flush()
+
+def _error(message):
+	"""Tell the user what was wrong with the input."""
+	if _config['protocol']:
+		_emit({'type': 'error', 'message': message})
+	else:
+		print(message)
+
+def _print_lines(lines):
+	"""Output of the show_* functions, one message in protocol mode."""
+	if _config['protocol']:
+		_emit({'type': 'show', 'lines': lines})
+	else:
+		for line in lines:
+			print(line)
+
+def _labelled(options, texts):
+	"""The options of a prompt in protocol mode. texts has at least one text per option."""
+	return [{'option': option, 'text': text} for option, text in zip(options, texts)]
+
+def _input(prompt):
+	"""input() or, if stdin is not a terminal, a plain buffered readline()."""
+	if _interactive():
+		return _journaled(lambda: input(prompt))
+
+	sys.stdout.write(prompt)
+	return _journaled(_next_line)
+
+def _echoed_key(echo):
+	"""Reads a key and writes echo formatted with it. Replayed keys aren't echoed, their output is hidden."""
+	key = _getkey()
+	sys.stdout.write(echo.format(key))
+	return key
+
+def _read_option(keys):
+	"""
+	Reads a line key by key and echoes it. One of the named keys is returned as it
+	is if it comes before anything is typed, other named keys are ignored.
+	"""
+	typed = ''
+	while True:
+		key = _getkey()
+		if key in keys and not typed:
+			sys.stdout.write("\n")
+			return key
+		elif key in ('\r', '\n'):
+			sys.stdout.write("\n")
+			return typed
+		elif key == '\x03':
+			raise KeyboardInterrupt()
+		elif key == '\x04' and not typed:
+			raise EOFError()
+		elif key in ('\x7f', '\b'):
+			if typed:
+				typed = typed[:-1]
+				sys.stdout.write("\b \b")
+		elif len(key) == 1 and key >= ' ':
+			typed += key
+			sys.stdout.write(key)
+		sys.stdout.flush()
+
+def _next_line():
+	line = sys.stdin.readline()
+	if not line:
+		raise EOFError()
+	return line.rstrip('\r\n')
+
+_stdin_checked = [None, None] # the last stdin that was checked and if it is a terminal
+def _interactive():
+	"""True if single keys can be read from stdin. Asks stdin only once."""
+	if _config['interactive'] is not None:
+		return _config['interactive']
+
+	if _stdin_checked[0] is not sys.stdin:
+		try:
+			tty = sys.stdin.isatty()
+		except (AttributeError, ValueError): # no stdin (pythonw) or closed
+			tty = False
+		_stdin_checked[:] = [sys.stdin, tty]
+	return _stdin_checked[1]
+
+def _import_readline():
+	try:
+		import readline
+		return readline
+	except ImportError:
+		return None
+
+_history_files = {}
+def _history():
+	"""The History of the configured history_file or None."""
+	path = _config['history_file']
+	if path is None:
+		return None
+
+	if path not in _history_files:
+		from .history import History
+		_history_files[path] = History(path)
+	return _history_files[path]
+
+_rankings = {}
+def _ranking():
+	"""The Ranking of the configured ranking_file or None if ranking is off."""
+	if _config['ranking'] is None:
+		return None
+
+	path = _config['ranking_file']
+	if path not in _rankings:
+		from .ranking import Ranking
+		_rankings[path] = Ranking(path)
+	return _rankings[path]
+
+def _ranked(key, my_list):
+	"""The indices of the best ranked entries, best first."""
+	ranking = _ranking()
+	if ranking is None:
+		return []
+	return ranking.top(key, [str(value) for value in my_list], min(_config['ranking_size'], 9))
+
+def _hotkeys(count, taken = ()):
+	"""Digits to pin the best ranked entries to, without the cancel option and the options already taken."""
+	taken = set(taken)
+	taken.add(_config['cancel_option'])
+	return [digit for digit in "123456789" if digit not in taken][:count]
+
+_journals = {}
+def _journal():
+	"""The Journal of the configured journal_file or None."""
+	path = _config['journal_file']
+	if path is None:
+		return None
+	if path in _journals:
+		return _journals[path]
+
+	from .journal import Journal
+	journal = Journal(path)
+	if not _journals:
+		import atexit
+		atexit.register(_close_journals)
+
+	_journals[path] = None # the question isn't part of the session
+	try:
+		if journal.answers and not get_boolean("Resume the previous session?", False):
+			journal.clear()
+	finally:
+		_journals[path] = journal
+
+	if journal.replaying():
+		sys.stdout = _HiddenOutput(sys.stdout)
+	return journal
+
+def _journaled(read):
+	"""Returns the next answer of a resumed session or read()s a new one and writes it to the journal."""
+	journal = _journal()
+	if journal is None:
+		return read()
+
+	if journal.replaying():
+		if isinstance(sys.stdout, _HiddenOutput):
+			del sys.stdout.parts[:]
+			# the frame of the next prompt has to be drawn completely
+			_screen.invalidate()
+		return journal.replay()
+
+	_show_hidden_output()
+	answer = read()
+	journal.append(answer)
+	return answer
+
+def _close_journals():
+	_show_hidden_output()
+
+	# an exception that ended the program is in sys.last_value, then the session can be resumed
+	ended_normally = getattr(sys, 'last_value', None) is None
+	for journal in _journals.values():
+		if journal is not None:
+			if ended_normally:
+				journal.clear()
+			journal.close()
+
+class _HiddenOutput(object):
+	"""Takes the place of sys.stdout while a session is resumed and keeps what was written since the last answer."""
+	def __init__(self, stdout):
+		self.stdout = stdout
+		self.parts = []
+
+	def write(self, text):
+		self.parts.append(text)
+
+	def flush(self):
+		pass
+
+def _show_hidden_output():
+	"""Show the current prompt when a resumed session runs out of answers."""
+	if isinstance(sys.stdout, _HiddenOutput):
+		hidden = sys.stdout
+		sys.stdout = hidden.stdout
+		sys.stdout.write(''.join(hidden.parts))
+
+def _remember(text, user_input):
+	history = _history()
+	if history is not None and user_input:
+		history.add(text, user_input)
+
+def _getkey():
+	if not _interactive():
+		# one answer per line, nothing to do for the terminal
+		return _next_line() or '\r'
+
+	from .xgetch import getkey
+	return getkey()
+
 def _use_default(user_input, default):
 	return default is not None and (len(user_input) == 0 or user_input == '\r')
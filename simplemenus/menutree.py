@@ -0,0 +1,217 @@
+"""
+Menu trees that are loaded from a JSON or TOML spec and compiled once.
+
+A spec describes a menu with a title and a list of entries. Every entry has a
+label and either an action (the dotted path of a function), a value that gets
+returned or a nested menu:
+
+	{
+		"title": "Build Tool",
+		"entries": [
+			{"label": "Build", "action": "build.build"},
+			{"label": "Documentation", "menu": {
+				"title": "Documentation",
+				"entries": [{"label": "Export", "action": "build.document"}]
+			}},
+			{"label": "Version", "value": "0.6"}
+		]
+	}
+
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+from __future__ import print_function
+import collections
+import os
+from . import main
+
+MenuTree = collections.namedtuple('MenuTree', 'nodes render_key')
+MenuTree.__doc__ = """A compiled menu tree. nodes[0] is the root menu."""
+
+MenuNode = collections.namedtuple('MenuNode', 'title path entries options lines')
+MenuNode.__doc__ = """One menu of a MenuTree with the titles leading to it, its options and rendered lines."""
+
+MenuEntry = collections.namedtuple('MenuEntry', 'label kind target')
+MenuEntry.__doc__ = """One entry of a MenuNode. kind is 'action', 'value' or 'menu' (target is the node index)."""
+
+_CACHE_VERSION = 2
+_callables = {}
+
+def load_menu_tree(path, cache = False):
+	"""
+	Load and compile a menu tree from a .json or .toml file.
+
+	Args:
+		path: the spec file
+		cache: Keep the compiled tree in path + '.cache' and reuse it as long as the spec
+			file doesn't change.
+	"""
+
+	import pickle
+	stat = os.stat(path)
+	cache_key = (_CACHE_VERSION, stat.st_mtime, stat.st_size, _render_key())
+	cache_path = path + '.cache'
+
+	if cache and os.path.exists(cache_path):
+		try:
+			with open(cache_path, 'rb') as f:
+				key, tree = pickle.load(f)
+			if key == cache_key:
+				return tree
+		except Exception:
+			pass # a broken cache gets rebuilt
+
+	tree = compile_menu_tree(_read_spec(path))
+
+	if cache:
+		temporary_path = cache_path + '.tmp'
+		try:
+			with open(temporary_path, 'wb') as f:
+				pickle.dump((cache_key, tree), f, pickle.HIGHEST_PROTOCOL)
+			# os.replace overwrites atomically, also on Windows (Python 2 only has rename)
+			getattr(os, 'replace', os.rename)(temporary_path, cache_path)
+		except (IOError, OSError):
+			pass # i.e. a read-only directory, the tree is fine without a cache
+
+	return tree
+
+def compile_menu_tree(spec):
+	"""Compile a spec (see the module documentation) that is already loaded into dicts and lists."""
+	nodes = []
+	_compile_node(spec, nodes)
+	return MenuTree(tuple(nodes), _render_key())
+
+def start_menu_tree(tree, show_cancel = True, args = [], kwargs = {}):
+	"""
+	Show the root menu of a tree and repeat until the user cancels or chooses a value.
+
+	Choosing a submenu shows it, canceling goes back to the parent menu. The home
+	option (see configure('home_option')) goes back to the root menu and the forward
+	option returns to the submenu that was left last. The headline shows the path to
+	the current menu. Actions get called with args and kwargs.
+
+	The menus are kept on an explicit stack, so deep or long navigation doesn't
+	grow the Python stack.
+
+	Returns:
+		The value of the chosen entry or None when the root menu was canceled
+	"""
+	stack = [0]
+	forward = []
+	while True:
+		node = tree.nodes[stack[-1]]
+		chosen = _choose_entry(tree, node, show_cancel or len(stack) > 1, len(stack) > 1, bool(forward))
+
+		if chosen == main._config['cancel_option']:
+			if len(stack) == 1:
+				return None
+			forward.append(stack.pop())
+		elif chosen == main._config['home_option']:
+			forward.extend(reversed(stack[1:]))
+			del stack[1:]
+		elif chosen == main._config['forward_option']:
+			stack.append(forward.pop())
+		elif chosen.kind == 'menu':
+			stack.append(chosen.target)
+			del forward[:]
+		elif chosen.kind == 'action':
+			main._run_action(_resolve(chosen.target), chosen.label, args, kwargs)
+		else:
+			return chosen.target
+
+def _choose_entry(tree, node, show_cancel, show_home, show_forward):
+	"""Returns the chosen entry or one of the cancel, home and forward options."""
+	lines = list(_node_lines(tree, node, show_cancel))
+	options = list(node.options)
+	texts = [entry.label for entry in node.entries]
+	if show_cancel:
+		options.append(main._config['cancel_option'])
+		texts.append(main._config['cancel_text'])
+
+	for key, shown in (('home', show_home), ('forward', show_forward)):
+		if shown:
+			option = main._config[key + '_option']
+			options.append(option)
+			texts.append(main._config[key + '_text'])
+			lines.append(main._config['list_format'].format(option=option, text=main._config[key + '_text']))
+
+	if main._config['protocol']:
+		headline = main._config['breadcrumb_separator'].join(node.path)
+		chosen = main._get_option(options, '', None, 'menu', main._labelled(options, texts), headline=headline)
+	else:
+		main._show_frame(lines)
+		chosen = main.get_option(options)
+
+	if chosen in node.options:
+		return node.entries[main._letter_to_number(chosen)]
+	return chosen
+
+def _node_lines(tree, node, show_cancel):
+	"""The precompiled lines unless the configuration changed since compiling."""
+	if tree.render_key == _render_key():
+		lines = node.lines
+	else:
+		lines = _render(node.path, [entry.label for entry in node.entries])
+
+	return lines if show_cancel else lines[:-2]
+
+def _render(path, labels):
+	headline = main._config['breadcrumb_separator'].join(path)
+	return tuple(main._headline_lines(headline) + main._list_lines(labels, True))
+
+def _render_key():
+	config = main._config
+	return (config['list_format'], config['cancel_option'], config['cancel_text'], config['empty_text'], config['breadcrumb_separator'])
+
+def _compile_node(spec, nodes, parent_path = ()):
+	"""Appends the node for spec and all its submenus to nodes and returns its index."""
+	index = len(nodes)
+	nodes.append(None) # reserve the index, submenus get appended after it
+	path = parent_path + (spec.get('title', ''),)
+
+	entries = []
+	for entry in spec.get('entries', []):
+		label = entry['label']
+		if 'menu' in entry:
+			entries.append(MenuEntry(label, 'menu', _compile_node(entry['menu'], nodes, path)))
+		elif 'action' in entry:
+			entries.append(MenuEntry(label, 'action', entry['action']))
+		elif 'value' in entry:
+			entries.append(MenuEntry(label, 'value', entry['value']))
+		else:
+			raise ValueError("Entry needs a menu, action or value: {}".format(label))
+
+	labels = [entry.label for entry in entries]
+	nodes[index] = MenuNode(path[-1], path, tuple(entries), tuple(main._enumerate_list(labels)), _render(path, labels))
+	return index
+
+def _resolve(path):
+	"""Import a callable given as 'package.module.function' or 'package.module:function'."""
+	if path not in _callables:
+		if ':' in path:
+			module_name, name = path.split(':', 1)
+		else:
+			module_name, name = path.rsplit('.', 1)
+		import importlib
+		action = main._resolve_action(getattr(importlib.import_module(module_name), name))
+		if action is None:
+			raise ValueError("Not callable: {}".format(path))
+		_callables[path] = action
+
+	return _callables[path]
+
+def _read_spec(path):
+	if path.endswith('.toml'):
+		try:
+			import tomllib
+		except ImportError:
+			try:
+				import tomli as tomllib
+			except ImportError:
+				raise ValueError("Reading TOML needs Python 3.11 or the tomli package: {}".format(path))
+		with open(path, 'rb') as f:
+			return tomllib.load(f)
+
+	import json
+	with open(path) as f:
+		return json.load(f)
@@ -0,0 +1,102 @@
+"""
+Menus that are built once and shown many times, i.e. huge generated menus.
+
+Example:
+
+	menu = Menu([MenuItem(host, connect_to(host)) for host in hosts] + [MenuItem('Quit', hotkey='q')])
+	start_menu(menu, "Hosts")
+
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import itertools
+from . import main
+
+class MenuItem(object):
+	"""
+	One entry of a Menu.
+
+	Args:
+		label: identifies the entry, i.e. for the ranking. It is shown unless there is a text.
+		value: gets called if it is callable (see start_menu()) otherwise returned. Default: the label
+		text: what gets shown
+		hotkey: the option that chooses the entry instead of its letter
+		enabled: disabled entries are shown but can't be chosen
+	"""
+
+	__slots__ = ('label', 'text', 'value', 'action', 'hotkey', 'enabled')
+
+	def __init__(self, label, value = None, text = None, hotkey = None, enabled = True):
+		self.label = label
+		self.text = label if text is None else text
+		self.value = label if value is None else value
+		self.action = main._resolve_action(self.value)
+		self.hotkey = hotkey
+		self.enabled = enabled
+
+	def __repr__(self):
+		return "MenuItem({!r}, {!r})".format(self.label, self.value)
+
+class Menu(object):
+	"""
+	A list of MenuItems for start_menu(), get_from_list() and get_from_dictionary().
+
+	Everything that showing and choosing needs is computed once: the options (letters
+	in order, skipping the hotkeys that are taken), a dict from option to position and
+	the lines. A hotkey can't be the cancel_option. The lines are only formatted again if list_format, disabled_option or
+	empty_text change.
+
+	Args:
+		items: MenuItems, (label, value) pairs, labels or a dict that maps labels to values
+	"""
+
+	__slots__ = ('items', 'keys', 'options', 'positions', 'texts', 'labels', '_lines', '_render_key')
+
+	def __init__(self, items):
+		if isinstance(items, dict):
+			items = items.items()
+		self.items = tuple(_item(item) for item in items)
+
+		taken = set()
+		for item in self.items:
+			if item.hotkey is not None:
+				if item.hotkey in taken:
+					raise ValueError("Duplicate hotkey: {}".format(item.hotkey))
+				if item.hotkey == main._config['cancel_option']:
+					raise ValueError("Hotkey is the cancel option: {}".format(item.hotkey))
+				taken.add(item.hotkey)
+
+		letters = (letter for letter in map(main._number_to_letter, itertools.count()) if letter not in taken)
+		self.keys = [next(letters) if item.hotkey is None else item.hotkey for item in self.items]
+		self.options = [key for key, item in zip(self.keys, self.items) if item.enabled]
+		self.positions = dict((key, i) for i, (key, item) in enumerate(zip(self.keys, self.items)) if item.enabled)
+		self.texts = [item.text for item in self.items]
+		self.labels = [str(item.label) for item in self.items]
+		self._lines = None
+		self._render_key = None
+
+	def __len__(self):
+		return len(self.items)
+
+	def __getitem__(self, i):
+		return self.items[i]
+
+	def lines(self):
+		"""One line per item or the empty_text."""
+		config = main._config
+		render_key = (config['list_format'], config['disabled_option'], config['empty_text'])
+		if render_key != self._render_key:
+			if self.items:
+				self._lines = [config['list_format'].format(option=key if item.enabled else config['disabled_option'], text=item.text)
+					for key, item in zip(self.keys, self.items)]
+			else:
+				self._lines = [config['empty_text']]
+			self._render_key = render_key
+		return self._lines
+
+def _item(item):
+	if isinstance(item, MenuItem):
+		return item
+	elif isinstance(item, tuple):
+		return MenuItem(*item)
+	return MenuItem(item)
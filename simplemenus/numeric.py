@@ -0,0 +1,136 @@
+"""
+Parsing of numbers, ranges and quantities with units, i.e. "-1,500", "10-20",
+"64k" or "2h". Used by get_number(), get_range() and get_numbers() of the main module.
+
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import re
+
+# k, m, g, ... are powers of 1024 (like ls -h), kb, mb, gb, ... powers of 1000
+SIZE_UNITS = {'': 1, 'b': 1}
+for _i, _prefix in enumerate('kmgtpe', 1):
+	SIZE_UNITS[_prefix] = SIZE_UNITS[_prefix + 'ib'] = 1024 ** _i
+	SIZE_UNITS[_prefix + 'b'] = 1000 ** _i
+
+# in seconds
+DURATION_UNITS = {'': 1, 's': 1, 'sec': 1, 'm': 60, 'min': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+_UNITS = {None: {'': 1}, 'size': SIZE_UNITS, 'duration': DURATION_UNITS}
+
+# larger exponents are typos, and 1e5000000 would be a number with five million digits
+_MAX_EXPONENT = 1000
+
+# sign, digits (optionally grouped by , or _), fraction, exponent and unit
+_NUMBER = r'([+-]?)(\d{1,3}(?:[,_]\d{3})+|\d+|(?=\.\d))(?:\.(\d*))?(?:[eE]([+-]?\d+))?\s*([a-zA-Z]*)'
+
+# One parser for single numbers and ranges (10-20 or 10..20)
+_PARSER = re.compile(r'\s*' + _NUMBER + r'(?:\s*(?:-|\.\.)\s*' + _NUMBER + r')?\s*$', getattr(re, 'ASCII', 0))
+
+def parse_number(text, kind = int, units = None, minimum = None, maximum = None):
+	"""
+	Converts text to a number of the given kind and raises ValueError with a message
+	for the user if it isn't one or out of range.
+
+	Args:
+		kind: int, float, decimal.Decimal or a similar class that takes a string
+		units: None, 'size', 'duration' or a dict that maps suffixes (lowercase) to factors
+		minimum, maximum: the allowed range, both inclusive
+	"""
+	match = _PARSER.match(text)
+	if match is None or match.group(6) is not None:
+		raise ValueError("Not a number: {}".format(text))
+
+	return _check(_convert(text, match.groups()[:5], kind, _units(units)), minimum, maximum)
+
+def parse_range(text, kind = int, units = None, minimum = None, maximum = None):
+	"""
+	Like parse_number() but for ranges like "10-20" or "1k..4k". Returns a tuple
+	(low, high). A single number is a range of one.
+	"""
+	match = _PARSER.match(text)
+	if match is None:
+		raise ValueError("Not a range: {}".format(text))
+
+	table = _units(units)
+	groups = match.groups()
+	low = _check(_convert(text, groups[:5], kind, table), minimum, maximum)
+	if groups[6] is None:
+		return low, low
+
+	high = _check(_convert(text, groups[5:], kind, table), minimum, maximum)
+	if high < low:
+		raise ValueError("Range ends before it starts: {}".format(text))
+	return low, high
+
+def parse_numbers(text, kind = int, units = None, minimum = None, maximum = None):
+	"""
+	Parses many numbers separated by whitespace or newlines at once, i.e. a pasted
+	column. Plain integers and floats are converted in bulk, only lists with separators
+	or units are parsed number by number.
+	"""
+	words = text.split()
+	values = None
+	if units is None and kind in (int, float):
+		try:
+			values = list(map(kind, words))
+		except ValueError:
+			pass
+		# float() also takes nan and inf, their sum isn't finite
+		if values and kind is float and sum(values) - sum(values) != 0:
+			values = None
+
+	if values is None:
+		# the parser accepts what the builtins don't and reports what is wrong
+		values = [parse_number(word, kind, units) for word in words]
+
+	if values and (minimum is not None or maximum is not None):
+		_check(min(values), minimum, None)
+		_check(max(values), None, maximum)
+	return values
+
+def _units(units):
+	return units if isinstance(units, dict) else _UNITS[units]
+
+def _convert(text, groups, kind, units):
+	sign, digits, fraction, exponent, unit = groups
+	factor = units.get(unit.lower())
+	if factor is None:
+		raise ValueError("Unknown unit: {}".format(unit) if unit else "Missing unit: {}".format(text))
+
+	digits = digits.replace(',', '').replace('_', '') or '0'
+	if kind is int and not fraction and exponent is None and isinstance(factor, int):
+		# the common case, no need for decimals
+		value = int(digits) * factor
+		return -value if sign == '-' else value
+
+	if exponent is not None and abs(int(exponent)) > _MAX_EXPONENT:
+		raise ValueError("Not a number: {}".format(text))
+
+	number = sign + digits + ('.' + fraction if fraction else '') + ('e' + exponent if exponent else '')
+	import decimal
+	try:
+		if kind is int:
+			value = _scale(decimal.Decimal(number), factor)
+			if value != value.to_integral_value():
+				raise ValueError("Not a whole number: {}".format(text))
+			return int(value)
+
+		return _scale(kind(number), factor)
+	except (decimal.DecimalException, OverflowError):
+		# i.e. an exponent beyond the limits of the decimal context
+		raise ValueError("Not a number: {}".format(text))
+
+def _scale(value, factor):
+	"""value * factor, also for factors the kind doesn't multiply with, i.e. a float factor of a custom unit for a Decimal."""
+	try:
+		return value * factor
+	except TypeError:
+		return value * type(value)(str(factor))
+
+def _check(value, minimum, maximum):
+	if minimum is not None and value < minimum:
+		raise ValueError("Must be at least {}".format(minimum))
+	if maximum is not None and value > maximum:
+		raise ValueError("Must be at most {}".format(maximum))
+	return value
@@ -0,0 +1,128 @@
+"""
+Progress bars and spinners for long running operations.
+
+Example:
+
+	with Progress(len(files), "Copying") as progress:
+		for f in files:
+			copy(f)
+			progress.update()
+
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import sys
+from . import main
+
+class Progress(object):
+	"""
+	Shows a progress bar on the current line.
+
+		Copying [##########----------]  50% (500/1000)
+
+	update() can be called from any thread. It only increments a counter of its own
+	thread, a background thread sums the counters and redraws at most fps times per
+	second and only if the sum changed.
+
+	In protocol mode nothing is drawn, a redraw sends a message instead:
+
+		{"type": "progress", "text": "Copying", "value": 500, "total": 1000}
+	"""
+
+	def __init__(self, total, text = '', fps = 10, width = 20):
+		self.total = total
+		self.text = text
+		self.width = width
+		self._interval = 1.0 / fps
+
+		import threading
+		self._local = threading.local()
+		self._counters = [] # one [steps] per updating thread, each is only written by its thread
+		self._counters_lock = threading.Lock()
+		self._drawn = None
+		self._draw_lock = threading.Lock()
+		self._stopped = threading.Event()
+		self._thread = threading.Thread(target=self._run)
+		self._thread.daemon = True
+		self._thread.start()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc_info):
+		self.close()
+
+	@property
+	def value(self):
+		"""How many steps are done."""
+		with self._counters_lock:
+			counters = list(self._counters)
+		return sum(counter[0] for counter in counters)
+
+	def update(self, steps = 1):
+		"""Mark steps as done."""
+		try:
+			counter = self._local.counter
+		except AttributeError:
+			# the first update of this thread
+			counter = self._local.counter = [0]
+			with self._counters_lock:
+				self._counters.append(counter)
+		counter[0] += steps
+
+	def refresh(self):
+		"""Redraw now if something changed."""
+		with self._draw_lock:
+			value = self.value
+			if main._config['protocol']:
+				if value != self._drawn:
+					main._emit({'type': 'progress', 'text': self.text, 'value': value, 'total': self.total})
+					self._drawn = value
+				return
+
+			line = self._line(value)
+			if line != self._drawn:
+				sys.stdout.write("\r" + line)
+				sys.stdout.flush()
+				self._drawn = line
+
+	def close(self):
+		"""Stop redrawing, draw the final state and move to the next line."""
+		if not self._stopped.is_set():
+			self._stopped.set()
+			self._thread.join()
+			self.refresh()
+			if not main._config['protocol']:
+				sys.stdout.write("\n")
+
+	def _run(self):
+		while not self._stopped.wait(self._interval):
+			self.refresh()
+
+	def _line(self, value):
+		done = min(value, self.total)
+		filled = int(self.width * done / self.total) if self.total else self.width
+		percent = int(100 * done / self.total) if self.total else 100
+		return "{}[{}{}] {:3d}% ({}/{})".format(self.text + " " if self.text else "", "#" * filled, "-" * (self.width - filled), percent, value, self.total)
+
+class Spinner(Progress):
+	"""
+	Shows a spinner and a counter for operations of unknown length.
+
+		Waiting / 42
+
+	The spinner turns on every redraw that sees progress.
+	"""
+
+	_FRAMES = "|/-\\"
+
+	def __init__(self, text = '', fps = 10):
+		self._frame = 0
+		self._last_value = None
+		Progress.__init__(self, None, text, fps)
+
+	def _line(self, value):
+		if value != self._last_value:
+			self._frame += 1
+			self._last_value = value
+		return "{}{} {}".format(self.text + " " if self.text else "", self._FRAMES[self._frame % len(self._FRAMES)], value)
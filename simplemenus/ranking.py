@@ -0,0 +1,116 @@
+"""
+Usage ranking of menu entries. Used by the main module if configure('ranking')
+is set.
+
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import bisect
+import json
+import math
+import os
+
+class Ranking(object):
+	"""
+	Ranks the entries of each menu by how often and how recently they were chosen.
+
+	Every choice adds 2 ** (n / half_life) to the score of the entry, where n counts
+	the choices in that menu. So an entry chosen half_life choices ago counts half as
+	much as one chosen now, and frequent entries still beat a single recent one. Old
+	scores never need to be updated because all weights grow at the same rate. The
+	scores are kept as logarithms so they don't overflow.
+
+	Each menu keeps its entries in a list sorted by score. A choice finds the old
+	position with bisect and inserts the new one, i.e. O(log n) comparisons.
+
+	With a path every choice is appended to the file as one JSON line with the new
+	score of the entry. Loading keeps the last line per entry and rewrites the file
+	once it holds more than twice as many lines as entries.
+	"""
+
+	def __init__(self, path = None, half_life = 10):
+		self.path = path
+		self.half_life = half_life
+		self._scores = {} # key -> {label: score}
+		self._order = {} # key -> [(-score, label), ...] best first
+		self._ticks = {} # key -> number of choices so far
+		self._file = None
+
+		if path is not None and os.path.exists(path):
+			self._load()
+
+	def close(self):
+		if self._file is not None:
+			self._file.close()
+			self._file = None
+
+	def choose(self, key, label):
+		"""Count a choice of label in the menu key."""
+		scores = self._scores.setdefault(key, {})
+		order = self._order.setdefault(key, [])
+		tick = self._ticks.get(key, 0) + 1
+		self._ticks[key] = tick
+
+		weight = float(tick) / self.half_life
+		if label in scores:
+			old = scores[label]
+			del order[bisect.bisect_left(order, (-old, label))]
+			high, low = max(old, weight), min(old, weight)
+			score = high + math.log(1 + 2 ** (low - high), 2)
+		else:
+			score = weight
+
+		scores[label] = score
+		bisect.insort(order, (-score, label))
+
+		if self.path is not None:
+			if self._file is None:
+				self._file = open(self.path, 'a')
+			self._file.write(json.dumps([key, label, score, tick]) + "\n")
+			self._file.flush()
+
+	def top(self, key, labels, count):
+		"""Returns the indices of the count best ranked labels, best first. Labels that were never chosen are left out."""
+		order = self._order.get(key)
+		if not order or count <= 0:
+			return []
+
+		positions = {}
+		for i, label in enumerate(labels):
+			positions.setdefault(label, i)
+
+		result = []
+		for score, label in order:
+			if label in positions:
+				result.append(positions[label])
+				if len(result) == count:
+					break
+		return result
+
+	def _load(self):
+		lines = 0
+		with open(self.path) as f:
+			for line in f:
+				try:
+					key, label, score, tick = json.loads(line)
+				except ValueError:
+					continue # torn last line of a crashed process
+				lines += 1
+				self._scores.setdefault(key, {})[label] = score
+				self._ticks[key] = max(self._ticks.get(key, 0), tick)
+
+		for key, scores in self._scores.items():
+			self._order[key] = sorted((-score, label) for label, score in scores.items())
+
+		entries = sum(len(scores) for scores in self._scores.values())
+		if lines > 2 * entries:
+			self._compact()
+
+	def _compact(self):
+		"""Rewrite the file with one line per entry."""
+		temporary = self.path + '.tmp'
+		with open(temporary, 'w') as f:
+			for key, order in self._order.items():
+				for score, label in order:
+					f.write(json.dumps([key, label, -score, self._ticks[key]]) + "\n")
+		getattr(os, 'replace', os.rename)(temporary, self.path)
@@ -0,0 +1,53 @@
+"""
+In-place redrawing with ANSI escape sequences. Used by the main module if
+configure('redraw', True) is set.
+
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import sys
+
+_CLEAR_SCREEN = "\x1b[H\x1b[2J"
+_CLEAR_LINE = "\x1b[2K"
+_CLEAR_BELOW = "\x1b[J"
+
+def _move_to(row):
+	return "\x1b[{};1H".format(row)
+
+class Screen(object):
+	"""
+	Draws frames (lists of lines) at the top of the terminal.
+
+	The previous frame is remembered and only the lines that changed get written
+	again. Everything below the frame (i.e. the prompt and the output of a menu
+	action) is cleared on every draw, start_menu() lets the user read the output
+	of an action first.
+
+	Lines must fit into the terminal width. If something scrolls the frame out
+	of its place call invalidate() (simplemenus.invalidate_screen() for the menus)
+	and the next draw repaints everything.
+	"""
+
+	def __init__(self):
+		self._lines = None
+
+	def invalidate(self):
+		"""Forget the previous frame. The next draw clears the screen."""
+		self._lines = None
+
+	def draw(self, lines, stream = None):
+		"""Draw a frame and leave the cursor on the line below it."""
+		stream = stream or sys.stdout
+
+		if self._lines is None:
+			output = [_CLEAR_SCREEN, "\n".join(lines), "\n"]
+		else:
+			output = []
+			for row, line in enumerate(lines):
+				if row >= len(self._lines) or self._lines[row] != line:
+					output.append(_move_to(row + 1) + _CLEAR_LINE + line)
+			output.append(_move_to(len(lines) + 1) + _CLEAR_BELOW)
+
+		self._lines = list(lines)
+		stream.write("".join(output))
+		stream.flush()
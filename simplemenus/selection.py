@@ -0,0 +1,72 @@
+"""
+A compact set of list indices. Used by get_many_from_list().
+
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+
+_POPCOUNT = [bin(i).count('1') for i in range(256)]
+
+class Selection(object):
+	"""
+	Stores which of size indices are selected as a bitset, i.e. one bit per index.
+	A selection over a million entries needs 125 kB.
+	"""
+
+	def __init__(self, size):
+		self.size = size
+		self._bits = bytearray((size + 7) // 8)
+
+	def __contains__(self, index):
+		return bool(self._bits[index >> 3] & (1 << (index & 7)))
+
+	def __len__(self):
+		return sum(_POPCOUNT[byte] for byte in self._bits)
+
+	def __iter__(self):
+		"""Iterates over the selected indices in ascending order."""
+		for position, byte in enumerate(self._bits):
+			if byte:
+				for bit in range(8):
+					if byte & (1 << bit):
+						yield (position << 3) + bit
+
+	def toggle(self, index):
+		self._check(index)
+		self._bits[index >> 3] ^= 1 << (index & 7)
+
+	def add(self, index):
+		self._check(index)
+		self._bits[index >> 3] |= 1 << (index & 7)
+
+	def discard(self, index):
+		self._check(index)
+		self._bits[index >> 3] &= ~(1 << (index & 7)) & 0xff
+
+	def set_range(self, start, stop, selected = True):
+		"""Selects (or deselects) all indices from start to stop (exclusive)."""
+		if start >= stop:
+			return
+		self._check(start)
+		self._check(stop - 1)
+
+		# Handle the bits before the first and after the last full byte one by one,
+		# everything in between with a single slice assignment.
+		first_full = min((start + 7) >> 3 << 3, stop)
+		last_full = max(stop >> 3 << 3, first_full)
+		update = self.add if selected else self.discard
+
+		for index in range(start, first_full):
+			update(index)
+		for index in range(last_full, stop):
+			update(index)
+
+		fill = 0xff if selected else 0x00
+		self._bits[first_full >> 3:last_full >> 3] = bytearray([fill]) * ((last_full - first_full) >> 3)
+
+	def clear(self):
+		self.set_range(0, self.size, False)
+
+	def _check(self, index):
+		if not 0 <= index < self.size:
+			raise IndexError("Index out of range: {}".format(index))
@@ -0,0 +1,80 @@
+"""
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import os
+import tempfile
+import unittest
+from simplemenus import *
+from simplemenus.completion import completer_for
+from simplemenus.test.test_main import IOTestCase
+
+HOSTS = ['host-a.example.com', 'host-b.example.com', 'hotel', 'db-1', 'db-10', 'db-2']
+
+class Test_Completer(unittest.TestCase):
+
+	def setUp(self):
+		self.completer = Completer(HOSTS)
+
+	def test_should_count_unique_candidates(self):
+		self.completer.add('db-1')
+		self.assertEqual(6, len(self.completer))
+
+	def test_should_contain_candidates_only(self):
+		self.assertIn('db-1', self.completer)
+		self.assertNotIn('db-', self.completer)
+		self.assertNotIn('db-100', self.completer)
+
+	def test_should_list_sorted_candidates(self):
+		self.assertEqual(['db-1', 'db-10', 'db-2'], self.completer.candidates('d'))
+		self.assertEqual(['host-a.example.com', 'host-b.example.com'], self.completer.candidates('host'))
+		self.assertEqual(sorted(HOSTS), self.completer.candidates())
+
+	def test_should_limit_candidates(self):
+		self.assertEqual(['db-1', 'db-10'], self.completer.candidates('db', limit=2))
+
+	def test_should_return_nothing_for_unknown_prefix(self):
+		self.assertEqual([], self.completer.candidates('x'))
+		self.assertEqual([], self.completer.candidates('hostx'))
+
+	def test_should_complete_common_part(self):
+		self.assertEqual('host-', self.completer.complete('hos'))
+		self.assertEqual('db-', self.completer.complete('d'))
+		self.assertEqual('db-1', self.completer.complete('db-1'))
+		self.assertEqual('hotel', self.completer.complete('hot'))
+
+	def test_should_keep_unknown_prefix(self):
+		self.assertEqual('x', self.completer.complete('x'))
+
+	def test_should_complete_empty_string(self):
+		self.assertEqual('', Completer().complete(''))
+		self.assertEqual('only', Completer(['only']).complete(''))
+
+
+
+class Test_completer_for(unittest.TestCase):
+
+	def test_should_wrap_functions(self):
+		completer = completer_for(lambda prefix: [h for h in HOSTS if h.startswith(prefix)])
+		self.assertEqual('host-', completer.complete('hos'))
+		self.assertEqual(['db-1', 'db-10'], completer.candidates('db-1'))
+
+	def test_should_read_files_once(self):
+		handle, path = tempfile.mkstemp()
+		try:
+			with os.fdopen(handle, 'w') as f:
+				f.write('\n'.join(HOSTS) + '\n\n')
+			completer = completer_for(path)
+			self.assertEqual(6, len(completer))
+			self.assertIs(completer, completer_for(path))
+		finally:
+			os.remove(path)
+
+
+
+class Test_get_string_completion(IOTestCase):
+
+	def test_should_list_candidates_for_tab_and_ask_again(self):
+		self.mockInput('db\t\ndb-2\n')
+		self.assertEqual('db-2', get_string('Host', completion=HOSTS))
+		self.assertOutput("Host> db-1\ndb-10\ndb-2\nHost> ")
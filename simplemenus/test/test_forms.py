@@ -0,0 +1,109 @@
+"""
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+from __future__ import print_function
+import datetime
+import collections
+import io
+from simplemenus import *
+from simplemenus.test.test_main import IOTestCase
+
+FIELDS = [('name', 'string'), ('age', 'integer', 18), ('birthday', 'date')]
+
+class Test_get_form(IOTestCase):
+
+	def test_should_print_fields_and_prompts(self):
+		self.mockInput('Mickey\n85\n18/11/1928\n')
+		get_form(FIELDS, 'Person')
+		self.assertOutput("""+--- Person ---+
+a) name
+b) age [18]
+c) birthday
+name> age> birthday> """)
+
+	def test_should_return_typed_record(self):
+		self.mockInput('Mickey\n85\n18/11/1928\n')
+		person = get_form(FIELDS)
+		self.assertEqual('Mickey', person.name)
+		self.assertEqual(85, person.age)
+		self.assertEqual(datetime.date(1928, 11, 18), person.birthday)
+
+	def test_should_use_defaults(self):
+		self.mockInput('Mickey\n\n18/11/1928\n')
+		self.assertEqual(18, get_form(FIELDS).age)
+
+	def test_should_accept_one_delimited_line(self):
+		self.mockInput('Mickey, 85, 18/11/1928\n')
+		self.assertEqual(('Mickey', 85, datetime.date(1928, 11, 18)), tuple(get_form(FIELDS)))
+
+	def test_should_ask_again_for_invalid_fields_only(self):
+		self.mockInput('Mickey\nx\ny\n85\n18/11/1928\n')
+		self.assertEqual(('Mickey', 85, datetime.date(1928, 11, 18)), tuple(get_form(FIELDS)))
+		self.assertOutput("""a) name
+b) age [18]
+c) birthday
+name> age> birthday> age: Not a number: x
+birthday: Not a date: y
+age> birthday> """)
+
+	def test_should_take_invalid_delimited_line_as_first_answer(self):
+		self.mockInput('Doe, John\n\n18/11/1928\n')
+		self.assertEqual(('Doe, John', 18, datetime.date(1928, 11, 18)), tuple(get_form(FIELDS)))
+		self.mockInput('Doe, John\n42\n')
+		self.assertEqual(('Doe, John', 42), tuple(get_form([('name', 'string'), ('age', 'integer')])))
+
+	def test_should_accept_ordered_dict_and_converters(self):
+		fields = collections.OrderedDict()
+		fields['ratio'] = float
+		fields['ok'] = 'boolean'
+		self.mockInput('0.5\nyes\n')
+		self.assertEqual((0.5, True), tuple(get_form(fields)))
+
+	def test_should_reject_unknown_types(self):
+		self.assertRaises(ValueError, get_form, [('name', 'unknown')])
+
+
+
+class Test_read_records(IOTestCase):
+
+	def test_should_read_csv_and_skip_header(self):
+		stream = io.StringIO(u"name,age,birthday\nMickey,85,18/11/1928\nDonald,,09/06/1934\n")
+		records = list(read_records(FIELDS, stream))
+		self.assertEqual(['Mickey', 'Donald'], [r.name for r in records])
+		self.assertEqual([85, 18], [r.age for r in records])
+
+	def test_should_read_json_lines(self):
+		stream = io.StringIO(u'{"name": "Mickey", "age": 85, "birthday": "18/11/1928"}\n\n["Donald", "90", "09/06/1934"]\n')
+		records = list(read_records(FIELDS, stream, format='jsonl'))
+		self.assertEqual([85, 90], [r.age for r in records])
+
+	def test_should_check_typed_json_values(self):
+		stream = io.StringIO(u'["Mickey", 85, "18/11/1928"]\n{"name": 5, "age": true, "birthday": 12}\n')
+		records = read_records(FIELDS, stream, format='jsonl')
+		self.assertEqual(85, next(records).age)
+		with self.assertRaises(ValueError) as context:
+			next(records)
+		self.assertTrue(str(context.exception).startswith("Line 2: age: "))
+
+	def test_should_report_line_of_invalid_json(self):
+		for line in (u'{"name": ', u'42'):
+			stream = io.StringIO(u'["Mickey", 85, "18/11/1928"]\n' + line + u'\n')
+			with self.assertRaises(ValueError) as context:
+				list(read_records(FIELDS, stream, format='jsonl'))
+			self.assertTrue(str(context.exception).startswith("Line 2: "), str(context.exception))
+
+	def test_should_report_line_of_invalid_value(self):
+		stream = io.StringIO(u"Mickey,85,18/11/1928\nDonald,x,09/06/1934\n")
+		records = read_records(FIELDS, stream)
+		next(records)
+		with self.assertRaises(ValueError) as context:
+			next(records)
+		self.assertEqual("Line 2: age: Not a number: x", str(context.exception))
+
+	def test_should_report_wrong_number_of_values(self):
+		stream = io.StringIO(u"Mickey,85\n")
+		self.assertRaises(ValueError, list, read_records(FIELDS, stream))
+
+	def test_should_reject_unknown_format(self):
+		self.assertRaises(ValueError, list, read_records(FIELDS, [], format='xml'))
@@ -0,0 +1,92 @@
+"""
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import collections
+import sys
+import unittest
+import simplemenus.fuzzy
+from simplemenus import *
+from simplemenus.fuzzy import FuzzyIndex
+from simplemenus.test.test_main import IOTestCase
+
+SERVICES = ['load-balancer', 'billing', 'auth-gateway', 'lb-backup', 'mail', 'ballot']
+
+class Test_FuzzyIndex(unittest.TestCase):
+
+	def setUp(self):
+		self.index = FuzzyIndex(SERVICES)
+
+	def test_should_match_characters_in_order(self):
+		self.assertEqual(['load-balancer'], self.index.search('ldbal'))
+
+	def test_should_rank_whole_matches_first(self):
+		self.assertEqual(['ballot', 'load-balancer'], self.index.search('bal'))
+
+	def test_should_ignore_case(self):
+		self.assertEqual(['mail'], self.index.search('MAIL'))
+
+	def test_should_limit_matches(self):
+		self.assertEqual(['ballot', 'billing'], self.index.search('b', limit=2))
+
+	def test_should_return_indices(self):
+		self.assertEqual([4], self.index.rank('mai'))
+
+	def test_should_narrow_previous_matches(self):
+		self.assertEqual(['auth-gateway'], self.index.search('aut'))
+		self.assertEqual(['auth-gateway'], self.index.search('autgw'))
+		self.assertEqual([], self.index.search('autx'))
+		self.assertEqual(['lb-backup', 'load-balancer', 'ballot', 'billing', 'mail'], self.index.search('l'))
+
+	def test_should_give_same_results_without_numpy(self):
+		numpy = simplemenus.fuzzy.numpy
+		try:
+			simplemenus.fuzzy.numpy = None
+			index = FuzzyIndex(SERVICES)
+			self.assertEqual(['ballot', 'load-balancer'], index.search('bal'))
+			self.assertEqual([], index.search('xyz'))
+		finally:
+			simplemenus.fuzzy.numpy = numpy
+
+	def test_should_not_match_characters_that_share_mask_bits(self):
+		# '@' and '$' share a bit of the mask
+		candidates = ['user@host', 'alpha', 'price$usd', 'a@b']
+		numpy = simplemenus.fuzzy.numpy
+		try:
+			simplemenus.fuzzy.numpy = None
+			without_numpy = [FuzzyIndex(candidates).search(query) for query in ('$', '@', 'p$')]
+		finally:
+			simplemenus.fuzzy.numpy = numpy
+		with_numpy = [FuzzyIndex(candidates).search(query) for query in ('$', '@', 'p$')]
+		self.assertEqual([['price$usd'], ['a@b', 'user@host'], ['price$usd']], without_numpy)
+		self.assertEqual(without_numpy, with_numpy)
+
+
+
+class Test_search_from_list(IOTestCase):
+
+	def test_should_show_matches_and_return_choice(self):
+		self.mockInput('ldbal\n')
+		self.mockSingleCharacterInput('a')
+		self.assertEqual('load-balancer', search_from_list(SERVICES, 'Service'))
+		self.assertOutput("""Service> a) load-balancer
+
+0) Cancel
+> a
+""")
+
+	def test_should_search_again_when_canceled_or_nothing_found(self):
+		self.mockInput('xyz\nbal\nmail\n')
+		self.mockSingleCharacterInput('0a')
+		self.assertEqual('mail', search_from_list(SERVICES))
+		self.assertIn("> No entries\n", sys.stdout.getvalue())
+
+	def test_should_return_none_for_empty_search(self):
+		self.mockInput('\n')
+		self.assertIs(None, search_from_list(SERVICES))
+
+	def test_should_search_dictionary_keys(self):
+		services = collections.OrderedDict((name, i) for i, name in enumerate(SERVICES))
+		self.mockInput('gate\n')
+		self.mockSingleCharacterInput('a')
+		self.assertEqual(2, search_from_dictionary(services))
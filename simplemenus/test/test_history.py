@@ -0,0 +1,126 @@
+"""
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import os
+import shutil
+import tempfile
+from simplemenus import *
+from simplemenus.history import History
+from simplemenus.test.test_main import IOTestCase
+
+class HistoryTestCase(IOTestCase):
+
+	def setUp(self):
+		IOTestCase.setUp(self)
+		self.directory = tempfile.mkdtemp()
+		self.path = os.path.join(self.directory, 'history')
+		self.histories = []
+
+	def tearDown(self):
+		IOTestCase.tearDown(self)
+		for history in self.histories:
+			history.close()
+		shutil.rmtree(self.directory)
+
+	def open(self):
+		history = History(self.path)
+		self.histories.append(history)
+		return history
+
+
+
+class Test_History(HistoryTestCase):
+
+	def test_should_start_empty(self):
+		self.assertEqual([], self.open().recent('name'))
+
+	def test_should_return_entries_of_key_newest_first(self):
+		history = self.open()
+		for i in range(3):
+			history.add('name', 'name {}'.format(i))
+			history.add('city', 'city {}'.format(i))
+		self.assertEqual(['name 2', 'name 1', 'name 0'], history.recent('name'))
+		self.assertEqual(['city 2', 'city 1'], history.recent('city', limit=2))
+
+	def test_should_skip_repeated_entries(self):
+		history = self.open()
+		history.add('name', 'Mickey')
+		history.add('name', 'Mickey')
+		self.assertEqual(['Mickey'], history.recent('name'))
+
+	def test_should_search_prefix(self):
+		history = self.open()
+		for value in ['host-a', 'db-1', 'host-b', 'db-2']:
+			history.add('host', value)
+		self.assertEqual('host-b', history.search('host', 'host'))
+		self.assertEqual('db-1', history.search('host', 'db-1'))
+		self.assertIs(None, history.search('host', 'x'))
+
+	def test_should_persist_across_sessions(self):
+		history = self.open()
+		history.add('name', u'Müller')
+		history.close()
+		self.assertEqual([u'Müller'], self.open().recent('name'))
+
+	def test_should_ignore_and_truncate_torn_record(self):
+		running = self.open()
+		running.add('name', 'one')
+		with open(self.path, 'ab') as f:
+			f.write(b'\x10\x00\x00\x00nam') # killed while appending
+
+		self.assertEqual(['one'], running.recent('name'))
+		history = self.open()
+		self.assertEqual(['one'], history.recent('name'))
+		history.add('name', 'two')
+		self.assertEqual(['two', 'one'], self.open().recent('name'))
+		self.assertEqual(['two', 'one'], running.recent('name'))
+
+	def test_should_see_entries_of_other_instances(self):
+		first, second = self.open(), self.open()
+		first.add('name', 'one')
+		self.assertEqual(['one'], second.recent('name'))
+		second.add('name', 'two')
+		first.add('other', 'x')
+		self.assertEqual(['two', 'one'], first.recent('name'))
+
+
+
+class Test_history_file(HistoryTestCase):
+
+	def setUp(self):
+		HistoryTestCase.setUp(self)
+		configure('history_file', self.path)
+
+	def test_should_remember_valid_answers(self):
+		self.mockInput('Mickey\n')
+		get_string('Name')
+		self.mockInput('x\n12\n')
+		get_integer('Age')
+		self.assertEqual(['Mickey'], self.open().recent('Name'))
+		self.assertEqual(['12'], self.open().recent('Age'))
+
+	def test_should_not_remember_defaults(self):
+		self.mockInput('\n')
+		get_string('Name', default='guest')
+		self.assertEqual([], self.open().recent('Name'))
+
+	def test_should_recall_answer_by_prefix(self):
+		self.mockInput('deploy web\ndeploy db\nstatus\n')
+		for i in range(3):
+			get_string('Command')
+		self.mockInput('!x\n!deploy w\n')
+		configure('interactive', True)
+		self.assertEqual('deploy web', get_string('Command'))
+		self.assertOutput("""Command> Command> Command> Command> No previous answer starts with: x
+Command> deploy web
+""")
+
+	def test_should_keep_answers_starting_with_exclamation_mark(self):
+		self.mockInput('deploy\n!!deploy\n')
+		get_string('Command')
+		configure('interactive', True)
+		self.assertEqual('!deploy', get_string('Command'))
+		configure('interactive', False)
+		self.mockInput('!deploy\n')
+		self.assertEqual('!deploy', get_string('Command'))
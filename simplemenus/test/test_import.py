@@ -0,0 +1,44 @@
+"""
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import subprocess
+import sys
+import unittest
+
+def imported_after(statement):
+	"""The modules a fresh interpreter imports for statement."""
+	code = "import sys; before = set(sys.modules); {}; print(' '.join(sorted(set(sys.modules) - before)))".format(statement)
+	output = subprocess.check_output([sys.executable, '-c', code], universal_newlines=True)
+	return set(output.split())
+
+@unittest.skipIf(sys.version_info < (3, 7), "imports are only lazy since Python 3.7")
+class Test_import(unittest.TestCase):
+
+	def test_should_import_nothing_but_the_package(self):
+		self.assertEqual(set(['simplemenus']), imported_after("import simplemenus"))
+
+	def test_should_import_main_on_first_use(self):
+		modules = imported_after("import simplemenus; simplemenus.get_string")
+		self.assertIn('simplemenus.main', modules)
+		for module in ['datetime', 'termios', 'tty', 'msvcrt', 'csv', 'json', 'pickle', 'threading', 'simplemenus.forms', 'simplemenus.width']:
+			self.assertNotIn(module, modules)
+
+	def test_should_not_import_heavy_modules_for_star_import(self):
+		modules = imported_after("from simplemenus import *")
+		self.assertIn('simplemenus.forms', modules)
+		for module in ['datetime', 'termios', 'tty', 'msvcrt', 'csv', 'json', 'pickle', 'threading', 'simplemenus.width']:
+			self.assertNotIn(module, modules)
+
+	def test_should_export_all_names(self):
+		import simplemenus
+		for name in simplemenus.__all__:
+			self.assertTrue(hasattr(simplemenus, name), name)
+		self.assertIn('get_string', dir(simplemenus))
+
+	def test_should_raise_attribute_error_for_unknown_names(self):
+		import simplemenus
+		self.assertRaises(AttributeError, getattr, simplemenus, 'no_such_function')
+
+if __name__ == '__main__':
+	unittest.main()
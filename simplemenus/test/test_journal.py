@@ -0,0 +1,88 @@
+"""
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from simplemenus.journal import Journal
+
+class Test_Journal(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.path = os.path.join(self.directory, 'journal')
+
+	def tearDown(self):
+		shutil.rmtree(self.directory)
+
+	def read(self):
+		with open(self.path) as f:
+			return f.read()
+
+	def test_should_append_answers_and_load_them_again(self):
+		journal = Journal(self.path)
+		journal.append('a')
+		journal.append(['b', 'c'])
+		self.assertEqual('"a"\n["b", "c"]\n', self.read())
+		journal.close()
+
+		journal = Journal(self.path)
+		self.assertTrue(journal.replaying())
+		self.assertEqual('a', journal.replay())
+		self.assertEqual(['b', 'c'], journal.replay())
+		self.assertFalse(journal.replaying())
+		journal.close()
+
+	def test_should_batch_fsync(self):
+		journal = Journal(self.path, sync_every = 3, sync_interval = 60)
+		journal.append('a')
+		journal.append('b')
+		self.assertEqual(2, journal._unsynced)
+		journal.append('c')
+		self.assertEqual(0, journal._unsynced)
+		journal.close()
+
+	def test_should_sync_on_timer(self):
+		journal = Journal(self.path, sync_every = 10, sync_interval = 0.01)
+		journal.append('a')
+		journal.append('b')
+		self.assertEqual(2, journal._unsynced)
+		journal._timer.join()
+		self.assertEqual(0, journal._unsynced)
+		journal.close()
+
+	def test_should_skip_completed_actions(self):
+		journal = Journal(self.path)
+		for answer in ['a', {'action': 'Outer'}, {'action': 'Inner'}, 'x', {'done': 'Inner'}, {'done': 'Outer'}, 'b', {'action': 'Outer'}, 'y']:
+			journal.append(answer)
+		journal.close()
+
+		journal = Journal(self.path)
+		self.assertEqual('a', journal.replay())
+		self.assertTrue(journal.skip_action('Outer'))
+		self.assertEqual('b', journal.replay())
+		self.assertFalse(journal.skip_action('Outer'))
+		self.assertEqual('y', journal.replay())
+		journal.close()
+
+	def test_should_drop_torn_last_line(self):
+		with open(self.path, 'w') as f:
+			f.write('"a"\n"b')
+		journal = Journal(self.path)
+		self.assertEqual(['a'], journal.answers)
+		journal.append('c')
+		journal.close()
+		self.assertEqual('"a"\n"c"\n', self.read())
+
+	def test_should_clear(self):
+		journal = Journal(self.path)
+		journal.append('a')
+		journal.clear()
+		journal.append('b')
+		journal.close()
+		self.assertEqual('"b"\n', self.read())
+
+if __name__ == '__main__':
+	unittest.main()
@@ -8,6 +8,11 @@ import io
 import datetime
 import sys
 import collections
+import functools
+import json
+import os
+import shutil
+import tempfile
 import simplemenus.main
 from simplemenus import *
 
@@ -17,6 +22,8 @@ def string_io_class():
 	else:
 		return io.BytesIO
 
+_getkey = simplemenus.main._getkey
+
 class IOTestCase(unittest.TestCase):
 	def setUp(self):
 		sys.stdout = string_io_class()()
@@ -24,6 +31,7 @@ class IOTestCase(unittest.TestCase):
 
 	def tearDown(self):
 		reset_config()
+		simplemenus.main._getkey = _getkey
 
 	def mockInput(self, input):
 		sys.stdin = string_io_class()(input)
@@ -36,7 +44,8 @@ class IOTestCase(unittest.TestCase):
 			else:
 				return input[-1:]
 
-		simplemenus.main._getch = mock_result
+		simplemenus.main._getkey = mock_result
+		configure('interactive', True)
 
 	def assertOutput(self, expected):
 		self.assertEqual(expected, sys.stdout.getvalue())
@@ -150,6 +159,42 @@ class Test_get_integer(IOTestCase):
 > Not a number: 
 > """)
 
+	def test_should_accept_negative_numbers_and_separators(self):
+		self.mockInput('-7\n1,500\n')
+		self.assertEqual(-7, get_integer())
+		self.assertEqual(1500, get_integer())
+
+class Test_get_number(IOTestCase):
+
+	def test_should_return_number_with_unit(self):
+		self.mockInput('1.5h\n')
+		self.assertEqual(5400.0, get_number(kind=float, units='duration'))
+
+	def test_should_ask_again_after_huge_exponent(self):
+		self.mockInput('1e5000000\n7\n')
+		self.assertEqual(7, get_integer())
+		self.assertIn("Not a number: 1e5000000", sys.stdout.getvalue())
+
+	def test_should_loop_until_number_is_in_range(self):
+		self.mockInput('5\n64k\n')
+		self.assertEqual(65536, get_number(units='size', minimum=1024))
+		self.assertOutput("""> Must be at least 1024
+> """)
+
+	def test_should_return_range(self):
+		self.mockInput('20-10\n10-20\n')
+		self.assertEqual((10, 20), get_range())
+		self.assertIn("Range ends before it starts: 20-10", sys.stdout.getvalue())
+
+	def test_should_return_default(self):
+		self.mockInput('\n')
+		self.assertEqual((1, 2), get_range(default=(1, 2)))
+
+	def test_should_return_numbers(self):
+		self.mockInput('1 2 x\n1 2 3k\n')
+		self.assertEqual([1, 2, 3072], get_numbers(units='size'))
+		self.assertIn("Not a number: x", sys.stdout.getvalue())
+
 
 
 class Test_get_date(IOTestCase):
@@ -323,6 +368,40 @@ b >>> b
 > a
 """)
 
+	def test_should_browse_on_cursor_keys(self):
+		configure('page_size', 2)
+		self.mockSingleCharacterInput([KEY_DOWN, KEY_DOWN, '\r'])
+		self.assertEqual('elephant', get_from_list(self.my_list))
+		self.assertOutput("""a) mouse
+b) elephant
+c) dog
+
+0) Cancel
+> down
+-> a) mouse
+   b) elephant
+(1-2 of 3)
+
+   0) Cancel
+> 
+   a) mouse
+-> b) elephant
+(1-2 of 3)
+
+   0) Cancel
+> 
+""")
+
+	def test_should_browse_long_lists_on_cursor_keys(self):
+		my_list = [str(i) for i in range(30)]
+		self.mockSingleCharacterInput([KEY_END, '\r', 'b', '\r'])
+		self.assertEqual('29', get_from_list(my_list))
+		self.assertEqual('1', get_from_list(my_list))
+
+	def test_should_keep_options_while_browsing(self):
+		self.mockSingleCharacterInput([KEY_END, 'a'])
+		self.assertEqual('mouse', get_from_list(self.my_list))
+
 class Test_get_from_dictionary(IOTestCase):
 
 	def setUp(self):
@@ -394,6 +473,180 @@ Must be one of: ['a', 'b', 'c']
 
 
 
+class Test_browse_list(IOTestCase):
+
+	def setUp(self):
+		IOTestCase.setUp(self)
+		configure('page_size', 2)
+		self.my_list = ["mouse", "elephant", "dog"]
+
+	def test_should_print_page_and_prompt(self):
+		self.mockSingleCharacterInput('\r')
+		browse_list(self.my_list, "Choose an animal")
+		self.assertOutput("""-> a) mouse
+   b) elephant
+(1-2 of 3)
+
+   0) Cancel
+Choose an animal> 
+""")
+
+	def test_should_return_highlighted_entry(self):
+		self.mockSingleCharacterInput([KEY_DOWN, '\r'])
+		self.assertEqual('elephant', browse_list(self.my_list))
+
+	def test_should_return_entry_of_typed_option(self):
+		self.mockSingleCharacterInput('b')
+		self.assertEqual('elephant', browse_list(self.my_list))
+
+	def test_should_keep_options_on_every_page(self):
+		self.mockSingleCharacterInput([KEY_PAGE_DOWN, 'c'])
+		self.assertEqual('dog', browse_list(self.my_list))
+		self.assertTrue(sys.stdout.getvalue().endswith("-> c) dog\n(3-3 of 3)\n\n   0) Cancel\n> \n"))
+
+	def test_should_read_options_of_long_lists_as_lines(self):
+		my_list = [str(i) for i in range(30)]
+		self.mockSingleCharacterInput([KEY_END, KEY_UP, '\r', KEY_DOWN, 'a', 'x', '\x7f', 'a', '\r'])
+		self.assertEqual('28', browse_list(my_list))
+		self.assertEqual('26', browse_list(my_list))
+		self.assertIn("-> cc) 28", sys.stdout.getvalue())
+
+	def test_should_stop_at_both_ends(self):
+		self.mockSingleCharacterInput([KEY_UP, KEY_END, KEY_DOWN, '\r'])
+		self.assertEqual('dog', browse_list(self.my_list))
+
+	def test_should_return_none_when_canceled(self):
+		self.mockSingleCharacterInput('0')
+		self.assertIs(None, browse_list(self.my_list))
+
+	def test_should_ignore_unknown_keys(self):
+		self.mockSingleCharacterInput([KEY_INSERT, 'x', KEY_HOME, '\r'])
+		self.assertEqual('mouse', browse_list(self.my_list))
+
+	def test_should_print_empty_text(self):
+		self.assertIs(None, browse_list([]))
+		self.assertOutput("No entries\n")
+
+
+
+class Test_non_interactive(IOTestCase):
+	"""StringIO is not a terminal, so without configure('interactive', True) every answer is a line."""
+
+	def setUp(self):
+		IOTestCase.setUp(self)
+		import simplemenus.xgetch
+		self.getkey = simplemenus.xgetch.getkey
+		simplemenus.xgetch.getkey = self.fail
+
+	def tearDown(self):
+		import simplemenus.xgetch
+		simplemenus.xgetch.getkey = self.getkey
+		IOTestCase.tearDown(self)
+
+	def test_should_read_single_letter_options_as_lines(self):
+		self.mockInput('b\nc\n0\n')
+		self.assertEqual('two', get_from_list(['one', 'two', 'three']))
+		self.assertEqual('three', get_from_list(['one', 'two', 'three']))
+		self.assertIs(None, get_from_list(['one', 'two', 'three']))
+
+	def test_should_read_character_as_line(self):
+		self.mockInput('x\n\n')
+		self.assertEqual('x', get_character())
+		self.assertEqual('d', get_character(default='d'))
+
+	def test_should_browse_with_key_names(self):
+		self.mockInput('down\n\n')
+		self.assertEqual('two', browse_list(['one', 'two', 'three']))
+
+	def test_should_raise_eof_error_at_end_of_input(self):
+		self.mockInput('')
+		self.assertRaises(EOFError, get_character)
+		self.assertRaises(EOFError, get_string)
+
+	def test_should_read_boolean_as_line(self):
+		self.mockInput('\nyes\nmaybe\nno\n')
+		self.assertEqual(True, get_boolean('Continue?', True))
+		self.assertEqual(True, get_boolean('Continue?'))
+		self.assertEqual(False, get_boolean('Continue?'))
+		self.assertIn("Not yes or no: maybe", sys.stdout.getvalue())
+
+	def test_should_detect_terminal_once_per_stdin(self):
+		calls = []
+		class Terminal(string_io_class()):
+			def isatty(self):
+				calls.append(True)
+				return True
+		self.mockSingleCharacterInput('a')
+		configure('interactive', None)
+		sys.stdin = Terminal()
+		self.assertEqual('a', get_option(['a', 'b']))
+		self.assertEqual('a', get_option(['a', 'b']))
+		self.assertEqual(1, len(calls))
+
+class Test_get_many_from_list(IOTestCase):
+
+	def setUp(self):
+		IOTestCase.setUp(self)
+		self.my_list = ["mouse", "elephant", "dog", "cat", "hamster"]
+
+	def test_should_print_list_and_count(self):
+		self.mockInput('a\n\n')
+		get_many_from_list(self.my_list[:2], "Choose animals")
+		self.assertOutput("""a) mouse
+b) elephant
+
+0) Cancel
+Choose animals> 1 selected
+Choose animals> """)
+
+	def test_should_toggle_entries(self):
+		self.mockInput('a c\na\n\n')
+		self.assertEqual(['dog'], get_many_from_list(self.my_list))
+
+	def test_should_select_ranges(self):
+		self.mockInput('b-d\n\n')
+		self.assertEqual(['elephant', 'dog', 'cat'], get_many_from_list(self.my_list))
+
+	def test_should_select_all_and_deselect(self):
+		self.mockInput('*,!b-c,!e\n\n')
+		self.assertEqual(['mouse', 'cat'], get_many_from_list(self.my_list))
+
+	def test_should_select_matching_filter(self):
+		self.mockInput('/M\n\n')
+		self.assertEqual(['mouse', 'hamster'], get_many_from_list(self.my_list))
+
+	def test_should_return_indices(self):
+		self.mockInput('/M\n\n')
+		self.assertEqual([0, 4], get_many_from_list(self.my_list, indices=True))
+
+	def test_should_return_none_when_canceled(self):
+		self.mockInput('a\n0\n')
+		self.assertIs(None, get_many_from_list(self.my_list))
+
+	def test_should_report_invalid_options(self):
+		self.mockInput('f\nbb\n\n')
+		self.assertEqual([], get_many_from_list(self.my_list, show_cancel=False))
+		self.assertOutput("""a) mouse
+b) elephant
+c) dog
+d) cat
+e) hamster
+> Not an option: f
+0 selected
+> Not an option: bb
+0 selected
+> """)
+
+	def test_should_show_selected_entries(self):
+		self.mockInput('b d\n?\n\n')
+		get_many_from_list(self.my_list, show_cancel=False)
+		self.assertTrue(sys.stdout.getvalue().endswith("""> 2 selected
+> a) elephant
+b) cat
+> """))
+
+
+
 class Test_show_functions(IOTestCase):
 
 	def test_show_enumerated_list(self):
@@ -414,6 +667,24 @@ c) dog
 | Hello World |
 +-------------+
 
+""")
+
+	def test_show_headline_with_wide_characters(self):
+		show_headline(u"\u65e5\u672c")
+		self.assertOutput(u"""
++------+
+| \u65e5\u672c |
++------+
+
+""")
+
+	def test_show_headline_with_colors(self):
+		show_headline(u"\x1b[1mBold\x1b[0m")
+		self.assertOutput(u"""
++------+
+| \x1b[1mBold\x1b[0m |
++------+
+
 """)
 
 	def test_show_small_headline(self):
@@ -423,6 +694,90 @@ c) dog
 
 
 
+class Test_tables(IOTestCase):
+
+	def setUp(self):
+		IOTestCase.setUp(self)
+		self.headers = ['host', 'status', 'load']
+		self.rows = [('web-1', 'up', 0.25), ('database-1', 'down', 0.0), ('cache', 'up', 1.5)]
+
+	def test_show_table(self):
+		show_table(self.rows, self.headers)
+		self.assertOutput("""   host        status  load
+a) web-1       up      0.25
+b) database-1  down    0.0
+c) cache       up      1.5
+""")
+
+	def test_show_table_with_dicts(self):
+		show_table([{'host': 'web-1', 'load': 2}], ['host', 'load'])
+		self.assertOutput("""   host   load
+a) web-1  2
+""")
+
+	def test_show_table_should_truncate_long_cells(self):
+		configure('column_width', 6)
+		show_table(self.rows)
+		self.assertOutput("""a) web-1   up    0.25
+b) dat...  down  0.0
+c) cache   up    1.5
+""")
+
+	def test_show_table_should_format_page_only(self):
+		class Row(object):
+			formatted = 0
+			def __str__(self):
+				Row.formatted += 1
+				return 'row'
+		rows = [[Row()] for i in range(1000)]
+		show_table(rows, start=30, count=2, sample=10)
+		self.assertOutput("""ee) row
+ff) row
+""")
+		self.assertEqual(12, Row.formatted)
+
+	def test_show_table_should_align_options_of_different_width(self):
+		rows = [('web-{}'.format(i), 'up') for i in range(30)]
+		show_table(rows, ['host', 'status'], start=24, count=4)
+		self.assertOutput("""    host    status
+y)  web-24  up
+z)  web-25  up
+aa) web-26  up
+bb) web-27  up
+""")
+
+	def test_show_table_when_empty(self):
+		show_table([], self.headers)
+		self.assertOutput("No entries\n")
+
+	def test_get_from_table(self):
+		self.mockSingleCharacterInput('b')
+		self.assertEqual(('database-1', 'down', 0.0), get_from_table(self.rows, self.headers, 'Choose a host'))
+		self.assertOutput("""   host        status  load
+a) web-1       up      0.25
+b) database-1  down    0.0
+c) cache       up      1.5
+
+0) Cancel
+Choose a host> b
+""")
+
+	def test_get_from_table_should_keep_options_on_pages(self):
+		self.mockSingleCharacterInput('ac')
+		self.assertEqual(('cache', 'up', 1.5), get_from_table(self.rows, start=1, count=2, show_cancel=False))
+		self.assertOutput("""b) database-1  down  0.0
+c) cache       up    1.5
+> a
+Must be one of: ['b', 'c']
+> c
+""")
+
+	def test_get_from_table_should_return_none_when_canceled(self):
+		self.mockSingleCharacterInput('0')
+		self.assertIs(None, get_from_table(self.rows))
+
+
+
 class Test_start_menu(IOTestCase):
 
 	def test_start_menu(self):
@@ -619,6 +974,283 @@ a) First Entry
 > 0
 """)
 
+	def test_start_menu_redraw_writes_only_changed_lines(self):
+		status = {'first': 'off'}
+		def first():
+			status['first'] = 'on'
+			self.menu.clear()
+			self.menu['First Entry (on)'] = first
+			self.menu['Second Entry'] = first
+
+		self.menu = collections.OrderedDict()
+		self.menu['First Entry (off)'] = first
+		self.menu['Second Entry'] = first
+
+		configure('redraw', True)
+		self.mockSingleCharacterInput('a0')
+		start_menu(self.menu, "Hello World")
+
+		self.assertOutput("""\x1b[H\x1b[2J
++-------------+
+| Hello World |
++-------------+
+
+a) First Entry (off)
+b) Second Entry
+
+0) Cancel
+> a
+\x1b[6;1H\x1b[2Ka) First Entry (on)\x1b[10;1H\x1b[J> 0
+""")
+
+	def test_start_menu_redraw_keeps_action_output_until_key(self):
+		self.menu = collections.OrderedDict([('Status', lambda: print("all up"))])
+		configure('redraw', True)
+		self.mockSingleCharacterInput('ax0')
+		start_menu(self.menu, "Hello World")
+		self.assertIn("> a\nall up\nPress any key to continue\n\x1b[9;1H\x1b[J> 0\n", sys.stdout.getvalue())
+
+	def test_invalidate_screen_repaints_everything(self):
+		configure('redraw', True)
+		self.mockSingleCharacterInput('a')
+		get_from_list(['one'])
+		invalidate_screen()
+		get_from_list(['one'])
+		self.assertEqual(2, sys.stdout.getvalue().count("\x1b[H\x1b[2J"))
+
+	def run_entry(self, value):
+		self.menu = collections.OrderedDict()
+		self.menu['Entry'] = value
+		self.mockSingleCharacterInput('a')
+		return start_menu(self.menu, "Hello World", repeat=False, args=['Mickey'])
+
+	def test_start_menu_calls_bound_methods(self):
+		class Greeter(object):
+			def greet(self, name):
+				print("hello " + name)
+		self.run_entry(Greeter().greet)
+		self.assertTrue(sys.stdout.getvalue().endswith("hello Mickey\n"))
+
+	def test_start_menu_calls_partials_and_builtins(self):
+		self.run_entry(functools.partial(print, "partial"))
+		self.assertTrue(sys.stdout.getvalue().endswith("partial Mickey\n"))
+
+	def test_start_menu_calls_callable_objects(self):
+		class Greeter(object):
+			def __call__(self, name):
+				print("called " + name)
+		self.run_entry(Greeter())
+		self.assertTrue(sys.stdout.getvalue().endswith("called Mickey\n"))
+
+	def test_start_menu_runs_coroutine_functions(self):
+		if sys.version_info < (3, 7):
+			return
+		namespace = {}
+		exec("async def greet(name):\n\tprint('async ' + name)", namespace)
+		self.run_entry(namespace['greet'])
+		self.assertTrue(sys.stdout.getvalue().endswith("async Mickey\n"))
+
+	def test_start_menu_returns_classes(self):
+		self.assertIs(collections.OrderedDict, self.run_entry(collections.OrderedDict))
+
+	def test_start_menu_resolves_replaced_entries_again(self):
+		def first(): print("first called")
+		def second(): print("second called")
+		def replace():
+			self.menu['Entry'] = second
+
+		self.menu = collections.OrderedDict()
+		self.menu['Entry'] = first
+		self.menu['Replace'] = replace
+		self.mockSingleCharacterInput('aba0')
+		start_menu(self.menu, "Hello World")
+		self.assertIn("first called", sys.stdout.getvalue())
+		self.assertIn("second called", sys.stdout.getvalue())
+
+class Test_protocol(IOTestCase):
+
+	def setUp(self):
+		IOTestCase.setUp(self)
+		configure('protocol', True)
+
+	def messages(self):
+		return [json.loads(line) for line in sys.stdout.getvalue().splitlines()]
+
+	def test_should_send_list_prompt_and_read_answer(self):
+		self.mockInput('"b"\n')
+		self.assertEqual('two', get_from_list(['one', 'two'], 'Number'))
+		self.assertEqual([{'type': 'list', 'text': 'Number', 'default': None, 'options': [
+			{'option': 'a', 'text': 'one'}, {'option': 'b', 'text': 'two'}, {'option': '0', 'text': 'Cancel'}]}], self.messages())
+
+	def test_should_send_menu_with_headline(self):
+		self.mockInput('"0"\n')
+		start_menu(collections.OrderedDict([('Run', lambda: None)]), 'Main')
+		self.assertEqual('menu', self.messages()[0]['type'])
+		self.assertEqual('Main', self.messages()[0]['headline'])
+
+	def test_should_report_errors_and_ask_again(self):
+		self.mockInput('"x"\nnot json\n{"a": 1}\n"a"\n')
+		self.assertEqual('one', get_from_list(['one'], show_cancel=False))
+		self.assertEqual(['list', 'error', 'list', 'error', 'list', 'error', 'list'], [m['type'] for m in self.messages()])
+		self.assertEqual("Must be one of: ['a']", self.messages()[1]['message'])
+
+	def test_should_convert_json_values(self):
+		self.mockInput('42\ntrue\nnull\n')
+		self.assertEqual(42, get_integer())
+		self.assertEqual(True, get_boolean())
+		self.assertEqual('x', get_string(default='x'))
+		self.assertEqual(['integer', 'boolean', 'string'], [m['type'] for m in self.messages()])
+
+	def test_should_choose_many_from_list_of_options(self):
+		self.mockInput('["c", "a"]\n')
+		self.assertEqual(['one', 'three'], get_many_from_list(['one', 'two', 'three']))
+
+	def test_should_send_shown_lines_as_one_message(self):
+		show_enumerated_list(['one', 'two'])
+		self.assertEqual([{'type': 'show', 'lines': ['a) one', 'b) two']}], self.messages())
+
+class Test_ranking(IOTestCase):
+
+	def setUp(self):
+		IOTestCase.setUp(self)
+		simplemenus.main._rankings.clear()
+		self.my_list = ['build', 'test', 'deploy']
+
+	def tearDown(self):
+		simplemenus.main._rankings.clear()
+		IOTestCase.tearDown(self)
+
+	def test_should_not_rank_by_default(self):
+		self.mockSingleCharacterInput('c')
+		get_from_list(self.my_list)
+		self.assertEqual({}, simplemenus.main._rankings)
+
+	def test_should_pin_most_used_entries_to_hotkeys(self):
+		configure('ranking', 'pin')
+		self.mockSingleCharacterInput('cbc1')
+		for i in range(3):
+			get_from_list(self.my_list)
+		sys.stdout = string_io_class()()
+		self.assertEqual('deploy', get_from_list(self.my_list))
+		self.assertOutput("""1) deploy
+2) test
+
+a) build
+b) test
+c) deploy
+
+0) Cancel
+> 1
+""")
+
+	def test_should_show_most_used_entries_first_with_their_letters(self):
+		configure('ranking', 'sort')
+		configure('ranking_size', 1)
+		self.mockSingleCharacterInput('cc')
+		get_from_list(self.my_list)
+		sys.stdout = string_io_class()()
+		self.assertEqual('deploy', get_from_list(self.my_list))
+		self.assertOutput("""c) deploy
+a) build
+b) test
+
+0) Cancel
+> c
+""")
+
+	def test_should_rank_menus_by_headline(self):
+		configure('ranking', 'pin')
+		self.mockSingleCharacterInput('b0b0')
+		menu = collections.OrderedDict([('One', lambda: None), ('Two', lambda: None)])
+		start_menu(menu, 'Main')
+		start_menu(menu, 'Main')
+		self.assertIn("1) Two", sys.stdout.getvalue())
+		self.assertEqual([1], simplemenus.main._ranking().top('Main', ['One', 'Two'], 3))
+
+class Test_journal(IOTestCase):
+
+	def setUp(self):
+		IOTestCase.setUp(self)
+		self.directory = tempfile.mkdtemp()
+		self.path = os.path.join(self.directory, 'journal')
+
+	def tearDown(self):
+		for journal in simplemenus.main._journals.values():
+			journal.close()
+		simplemenus.main._journals.clear()
+		IOTestCase.tearDown(self)
+		shutil.rmtree(self.directory)
+
+	def write_journal(self, answers):
+		with open(self.path, 'w') as f:
+			f.write("".join(json.dumps(answer) + "\n" for answer in answers))
+
+	def read_journal(self):
+		with open(self.path) as f:
+			return [json.loads(line) for line in f]
+
+	def test_should_write_answers(self):
+		configure('journal_file', self.path)
+		self.mockInput('bob\n42\n')
+		get_string('Name')
+		get_integer('Age')
+		self.assertEqual(['bob', '42'], self.read_journal())
+
+	def test_should_resume_without_output(self):
+		self.write_journal(['bob', '42'])
+		self.mockInput('y\nb\n')
+		configure('journal_file', self.path)
+		self.assertEqual('bob', get_string('Name'))
+		self.assertEqual(42, get_integer('Age'))
+		self.assertEqual('two', get_from_list(['one', 'two'], 'Choose'))
+		self.assertOutput("""Resume the previous session?> a) one
+b) two
+
+0) Cancel
+Choose> """)
+		self.assertEqual(['bob', '42', 'b'], self.read_journal())
+
+	def test_should_start_over_if_not_resumed(self):
+		self.write_journal(['bob'])
+		self.mockInput('n\nalice\n')
+		configure('journal_file', self.path)
+		self.assertEqual('alice', get_string('Name'))
+		self.assertEqual(['alice'], self.read_journal())
+
+	def test_should_replay_keys(self):
+		self.write_journal(['b'])
+		self.mockInput('y\n')
+		configure('journal_file', self.path)
+		self.mockSingleCharacterInput('a')
+		self.assertEqual('two', get_from_list(['one', 'two']))
+		self.assertEqual('one', get_from_list(['one', 'two']))
+
+	def test_should_skip_completed_actions(self):
+		called = []
+		def deploy():
+			called.append(get_string('Version'))
+		menu = collections.OrderedDict([('Deploy', deploy), ('Quit', 'quit')])
+
+		configure('journal_file', self.path)
+		self.mockInput('a\n1.0\na\n')
+		self.assertRaises(EOFError, start_menu, menu, 'Main') # interrupted during the second deploy
+		self.assertEqual(['1.0'], called)
+		simplemenus.main._journals.pop(self.path).close()
+
+		self.mockInput('y\n2.1\nb\n')
+		configure('journal_file', self.path)
+		self.assertEqual('quit', start_menu(menu, 'Main'))
+		self.assertEqual(['1.0', '2.1'], called)
+
+	def test_should_not_echo_replayed_keys(self):
+		self.write_journal(['x'])
+		self.mockInput('y\n')
+		configure('journal_file', self.path)
+		self.mockSingleCharacterInput('z')
+		self.assertEqual('x', get_character('First'))
+		self.assertEqual('z', get_character('Second'))
+		self.assertOutput("Resume the previous session?> Second> z\n")
+
 class Test_configure(IOTestCase):
 	"""
 	These are just the general configuration tests. EVerything specific to a particular function in the related test class
@@ -0,0 +1,193 @@
+"""
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+from __future__ import print_function
+import json
+import os
+import pickle
+import sys
+import shutil
+import tempfile
+import simplemenus.menutree
+from simplemenus import *
+from simplemenus.test.test_main import IOTestCase
+
+def say_hello(name = 'World'):
+	print("Hello " + name)
+
+SPEC = {
+	'title': 'Main',
+	'entries': [
+		{'label': 'Hello', 'action': 'simplemenus.test.test_menutree.say_hello'},
+		{'label': 'Sub', 'menu': {
+			'title': 'Sub',
+			'entries': [
+				{'label': 'Hello', 'action': 'simplemenus.test.test_menutree:say_hello'},
+				{'label': 'Answer', 'value': 42}]}},
+	]}
+
+class Test_compile_menu_tree(IOTestCase):
+
+	def test_should_index_nodes(self):
+		tree = compile_menu_tree(SPEC)
+		self.assertEqual(['Main', 'Sub'], [node.title for node in tree.nodes])
+		self.assertEqual(('menu', 1), tree.nodes[0].entries[1][1:])
+		self.assertEqual(('a', 'b'), tree.nodes[1].options)
+
+	def test_should_precompute_lines(self):
+		tree = compile_menu_tree(SPEC)
+		self.assertEqual(('', '+------+', '| Main |', '+------+', '', 'a) Hello', 'b) Sub', '', '0) Cancel'), tree.nodes[0].lines)
+
+	def test_should_reject_entries_without_target(self):
+		self.assertRaises(ValueError, compile_menu_tree, {'entries': [{'label': 'Nothing'}]})
+
+
+
+class Test_start_menu_tree(IOTestCase):
+
+	def setUp(self):
+		IOTestCase.setUp(self)
+		self.tree = compile_menu_tree(SPEC)
+
+	def test_should_run_actions_and_repeat(self):
+		self.mockSingleCharacterInput('a0')
+		self.assertIs(None, start_menu_tree(self.tree, args=['Mickey']))
+		self.assertOutput("""
++------+
+| Main |
++------+
+
+a) Hello
+b) Sub
+
+0) Cancel
+> a
+Hello Mickey
+
++------+
+| Main |
++------+
+
+a) Hello
+b) Sub
+
+0) Cancel
+> 0
+""")
+
+	def test_should_return_to_parent_when_submenu_is_canceled(self):
+		self.mockSingleCharacterInput('b0b00')
+		self.assertIs(None, start_menu_tree(self.tree))
+		self.assertEqual(5, sys.stdout.getvalue().count('\n> '))
+
+	def test_should_show_breadcrumbs_and_home_in_submenu(self):
+		self.mockSingleCharacterInput('b^0')
+		start_menu_tree(self.tree)
+		self.assertIn("""
++------------+
+| Main > Sub |
++------------+
+
+a) Hello
+b) Answer
+
+0) Cancel
+^) Home
+> ^
+""", sys.stdout.getvalue())
+
+	def test_should_go_forward_to_last_submenu(self):
+		self.mockSingleCharacterInput('b0+b')
+		self.assertEqual(42, start_menu_tree(self.tree))
+		self.assertIn("0) Cancel\n+) Forward\n> +", sys.stdout.getvalue())
+
+	def test_should_go_forward_after_home(self):
+		self.mockSingleCharacterInput('b^+b')
+		self.assertEqual(42, start_menu_tree(self.tree))
+
+	def test_should_not_grow_the_stack_with_navigation(self):
+		import inspect
+		depths = []
+		def record_depth():
+			depths.append(len(inspect.stack()))
+		simplemenus.menutree._callables['depth'] = record_depth
+		tree = compile_menu_tree({'entries': [{'label': 'Depth', 'action': 'depth'}, {'label': 'Sub', 'menu': {'entries': []}}]})
+		self.mockSingleCharacterInput('ab0b0a0')
+		start_menu_tree(tree)
+		self.assertEqual(depths[0], depths[1])
+
+	def test_should_return_value_from_submenu(self):
+		self.mockSingleCharacterInput('bb')
+		self.assertEqual(42, start_menu_tree(self.tree))
+
+	def test_should_render_with_changed_configuration(self):
+		configure('list_format', '{option}] {text}')
+		self.mockSingleCharacterInput('0')
+		start_menu_tree(self.tree)
+		self.assertIn('a] Hello', sys.stdout.getvalue())
+
+	def test_should_hide_cancel(self):
+		self.mockSingleCharacterInput('bb')
+		start_menu_tree(self.tree, show_cancel=False)
+		self.assertIn("b) Sub\n> b", sys.stdout.getvalue())
+
+	def test_should_send_menus_in_protocol_mode(self):
+		configure('protocol', True)
+		self.mockInput('"b"\n"^"\n"0"\n')
+		start_menu_tree(self.tree)
+		messages = [json.loads(line) for line in sys.stdout.getvalue().splitlines()]
+		self.assertEqual(['Main', 'Main > Sub', 'Main'], [message['headline'] for message in messages])
+		self.assertEqual({'option': '^', 'text': 'Home'}, messages[1]['options'][-1])
+
+
+
+class Test_load_menu_tree(IOTestCase):
+
+	def setUp(self):
+		IOTestCase.setUp(self)
+		self.directory = tempfile.mkdtemp()
+		self.path = os.path.join(self.directory, 'menu.json')
+		with open(self.path, 'w') as f:
+			json.dump(SPEC, f)
+
+	def tearDown(self):
+		IOTestCase.tearDown(self)
+		shutil.rmtree(self.directory)
+
+	def test_should_load_json(self):
+		self.assertEqual(compile_menu_tree(SPEC), load_menu_tree(self.path))
+
+	def test_should_write_and_reuse_cache(self):
+		tree = load_menu_tree(self.path, cache=True)
+		self.assertTrue(os.path.exists(self.path + '.cache'))
+
+		with open(self.path + '.cache', 'rb') as f:
+			key, cached = pickle.load(f)
+		self.assertEqual(tree, cached)
+
+		changed = tree._replace(nodes=tree.nodes[:1])
+		with open(self.path + '.cache', 'wb') as f:
+			pickle.dump((key, changed), f)
+		self.assertEqual(changed, load_menu_tree(self.path, cache=True))
+
+	def test_should_ignore_stale_cache(self):
+		tree = load_menu_tree(self.path, cache=True)
+		with open(self.path + '.cache', 'wb') as f:
+			pickle.dump((None, tree._replace(nodes=())), f)
+		self.assertEqual(tree, load_menu_tree(self.path, cache=True))
+
+	def test_should_load_without_cache_if_it_cant_be_written(self):
+		os.mkdir(self.path + '.cache.tmp') # can't be opened for writing, like a read-only directory
+		self.assertEqual(compile_menu_tree(SPEC), load_menu_tree(self.path, cache=True))
+		self.assertFalse(os.path.exists(self.path + '.cache'))
+
+	def test_should_load_toml(self):
+		try:
+			import tomllib
+		except ImportError:
+			return
+		path = os.path.join(self.directory, 'menu.toml')
+		with open(path, 'w') as f:
+			f.write('title = "Main"\n[[entries]]\nlabel = "Answer"\nvalue = 42\n')
+		self.assertEqual(42, load_menu_tree(path).nodes[0].entries[0].target)
@@ -0,0 +1,105 @@
+"""
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import collections
+import sys
+from simplemenus import *
+from simplemenus.test.test_main import IOTestCase
+
+class Test_Menu(IOTestCase):
+
+	def test_should_accept_items_pairs_labels_and_dicts(self):
+		menus = [Menu([MenuItem('one', 1), MenuItem('two', 2)]), Menu([('one', 1), ('two', 2)]),
+			Menu(collections.OrderedDict([('one', 1), ('two', 2)]))]
+		for menu in menus:
+			self.assertEqual(['one', 'two'], [item.label for item in menu.items])
+			self.assertEqual([1, 2], [item.value for item in menu.items])
+		self.assertEqual('one', Menu(['one']).items[0].value)
+
+	def test_should_skip_letters_taken_by_hotkeys(self):
+		menu = Menu([MenuItem('one'), MenuItem('Quit', hotkey='b'), MenuItem('two')])
+		self.assertEqual(['a', 'b', 'c'], menu.options)
+		self.assertEqual(2, menu.positions['c'])
+		self.assertRaises(ValueError, Menu, [MenuItem('one', hotkey='q'), MenuItem('two', hotkey='q')])
+		self.assertRaises(ValueError, Menu, [MenuItem('Run', hotkey='0')])
+
+	def test_should_not_offer_disabled_items(self):
+		menu = Menu([MenuItem('one'), MenuItem('two', enabled=False), MenuItem('three')])
+		self.assertEqual(['a', 'c'], menu.options)
+		self.assertEqual(['a) one', '-) two', 'c) three'], menu.lines())
+
+	def test_should_precompute_actions(self):
+		function = lambda: None
+		self.assertIsNotNone(MenuItem('run', function).action)
+		self.assertIsNone(MenuItem('value', 42).action)
+
+	def test_should_render_lines_once_per_configuration(self):
+		menu = Menu(['one'])
+		self.assertIs(menu.lines(), menu.lines())
+		configure('list_format', '{option}] {text}')
+		self.assertEqual(['a] one'], menu.lines())
+		self.assertEqual(['No entries'], Menu([]).lines())
+
+class Test_choosing_from_menu(IOTestCase):
+
+	def setUp(self):
+		IOTestCase.setUp(self)
+		self.called = []
+		self.menu = Menu([MenuItem('Run', lambda: self.called.append('run')), MenuItem('Answer', 42),
+			MenuItem('Broken', enabled=False), MenuItem('Quit', 'quit', hotkey='q')])
+
+	def test_should_return_value_from_get_from_list(self):
+		self.mockSingleCharacterInput('b')
+		self.assertEqual(42, get_from_list(self.menu))
+		self.assertOutput("""a) Run
+b) Answer
+-) Broken
+q) Quit
+
+0) Cancel
+> b
+""")
+
+	def test_should_reject_disabled_items(self):
+		self.mockSingleCharacterInput('cq')
+		self.assertEqual('quit', get_from_dictionary(self.menu))
+		self.assertIn("Must be one of: ['a', 'b', 'q', '0']", sys.stdout.getvalue())
+
+	def test_should_run_actions_in_start_menu(self):
+		self.mockSingleCharacterInput('aab')
+		self.assertEqual(42, start_menu(self.menu, 'Main'))
+		self.assertEqual(['run', 'run'], self.called)
+
+	def test_should_browse_menu_and_skip_disabled_items(self):
+		self.mockSingleCharacterInput([KEY_END, KEY_UP, '\r', KEY_UP, '\r'])
+		self.assertEqual(42, start_menu(self.menu, 'Main'))
+		self.assertIn("-> -) Broken", sys.stdout.getvalue())
+
+	def test_should_cancel(self):
+		self.mockSingleCharacterInput('0')
+		self.assertIsNone(start_menu(self.menu, 'Main'))
+		self.assertIsNone(get_from_list(self.menu))
+
+	def test_should_rank_menu_items(self):
+		import simplemenus.main
+		simplemenus.main._rankings.clear()
+		configure('ranking', 'pin')
+		self.mockSingleCharacterInput('q1')
+		get_from_list(self.menu)
+		sys.stdout = type(sys.stdout)()
+		self.assertEqual('quit', get_from_list(self.menu))
+		self.assertTrue(sys.stdout.getvalue().startswith("1) Quit\n\na) Run"))
+		simplemenus.main._rankings.clear()
+
+	def test_should_not_pin_to_hotkeys_of_items(self):
+		import simplemenus.main
+		simplemenus.main._rankings.clear()
+		configure('ranking', 'pin')
+		menu = Menu([MenuItem('Run', 'run'), MenuItem('Stop', 'stop', hotkey='1')])
+		self.mockSingleCharacterInput('a1')
+		get_from_list(menu)
+		sys.stdout = type(sys.stdout)()
+		self.assertEqual('stop', get_from_list(menu))
+		self.assertTrue(sys.stdout.getvalue().startswith("2) Run\n\na) Run"))
+		simplemenus.main._rankings.clear()
@@ -0,0 +1,84 @@
+"""
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import decimal
+import unittest
+from simplemenus.numeric import *
+
+class Test_parse_number(unittest.TestCase):
+
+	def test_should_parse_signs_and_separators(self):
+		self.assertEqual(-1500, parse_number('-1,500'))
+		self.assertEqual(1000000, parse_number('+1_000_000'))
+		self.assertEqual(1000, parse_number(' 1e3 '))
+
+	def test_should_parse_kinds(self):
+		self.assertEqual(0.25, parse_number('.25', float))
+		self.assertEqual(decimal.Decimal('0.10'), parse_number('0.10', decimal.Decimal))
+		self.assertRaises(ValueError, parse_number, '1.5')
+
+	def test_should_apply_units(self):
+		self.assertEqual(65536, parse_number('64k', units='size'))
+		self.assertEqual(1536, parse_number('1.5 KiB', units='size'))
+		self.assertEqual(2000000, parse_number('2MB', units='size'))
+		self.assertEqual(300, parse_number('5m', units='duration'))
+		self.assertEqual(7200, parse_number('2h', units='duration'))
+		self.assertEqual(3, parse_number('3x', units={'x': 1}))
+
+	def test_should_reject_huge_exponents(self):
+		for kind in (int, float, decimal.Decimal):
+			self.assertRaises(ValueError, parse_number, '1e5000000', kind)
+		self.assertRaises(ValueError, parse_number, '1e999999', decimal.Decimal, {'': 10})
+		self.assertEqual(10 ** 20, parse_number('1e20'))
+
+	def test_should_apply_factors_of_other_types(self):
+		self.assertEqual(decimal.Decimal('0.3'), parse_number('3 tenths', decimal.Decimal, {'tenths': 0.1}))
+		self.assertEqual(3, parse_number('6 halves', units={'halves': 0.5}))
+		self.assertRaises(ValueError, parse_number, '3 halves', units={'halves': 0.5})
+
+	def test_should_reject_invalid_input(self):
+		for text, message in [('a', "Not a number: a"), ('', "Not a number: "), ('1,50', "Not a number: 1,50"),
+				('10-20', "Not a number: 10-20"), ('5q', "Unknown unit: q"), ('3', "Missing unit: 3")]:
+			try:
+				parse_number(text, units={'x': 1} if text == '3' else None)
+				self.fail(text)
+			except ValueError as e:
+				self.assertEqual(message, str(e))
+
+	def test_should_check_minimum_and_maximum(self):
+		self.assertEqual(10, parse_number('10', minimum=10, maximum=10))
+		self.assertRaises(ValueError, parse_number, '9', minimum=10)
+		self.assertRaises(ValueError, parse_number, '2k', units='size', maximum=2000)
+
+class Test_parse_range(unittest.TestCase):
+
+	def test_should_parse_ranges(self):
+		self.assertEqual((10, 20), parse_range('10-20'))
+		self.assertEqual((-5, -1), parse_range('-5--1'))
+		self.assertEqual((1024, 4096), parse_range('1k..4k', units='size'))
+		self.assertEqual((7, 7), parse_range('7'))
+
+	def test_should_reject_reversed_ranges(self):
+		self.assertRaises(ValueError, parse_range, '20-10')
+		self.assertRaises(ValueError, parse_range, '0-20', minimum=1)
+
+class Test_parse_numbers(unittest.TestCase):
+
+	def test_should_parse_plain_numbers_in_bulk(self):
+		self.assertEqual(list(range(1000)), parse_numbers("\n".join(str(i) for i in range(1000))))
+		self.assertEqual([0.5, 2.0], parse_numbers("0.5 2", float))
+
+	def test_should_fall_back_to_parser(self):
+		self.assertEqual([1500, -2], parse_numbers("1,500\n-2"))
+		self.assertEqual([1024, 2048], parse_numbers("1k 2k", units='size'))
+		self.assertRaises(ValueError, parse_numbers, "1 nan", float)
+		self.assertRaises(ValueError, parse_numbers, "1 x")
+
+	def test_should_check_minimum_and_maximum(self):
+		self.assertRaises(ValueError, parse_numbers, "1 2 30", maximum=10)
+		self.assertRaises(ValueError, parse_numbers, "1 2 30", minimum=2)
+		self.assertEqual([], parse_numbers("", minimum=2))
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,67 @@
+"""
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import sys
+import threading
+import time
+from simplemenus import *
+from simplemenus.test.test_main import IOTestCase
+
+class Test_Progress(IOTestCase):
+
+	def test_should_draw_bar_on_close(self):
+		with Progress(4, "Copying", width=8) as progress:
+			progress.update()
+		self.assertTrue(sys.stdout.getvalue().endswith("\rCopying [##------]  25% (1/4)\n"))
+
+	def test_should_count_updates_from_many_threads(self):
+		progress = Progress(40000, fps=1000)
+		def work():
+			for i in range(10000):
+				progress.update()
+		threads = [threading.Thread(target=work) for i in range(4)]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+		progress.close()
+		self.assertEqual(40000, progress.value)
+		self.assertTrue(sys.stdout.getvalue().endswith("100% (40000/40000)\n"))
+
+	def test_should_add_several_steps(self):
+		with Progress(100) as progress:
+			progress.update(30)
+			progress.update()
+			self.assertEqual(31, progress.value)
+
+	def test_should_only_redraw_when_changed(self):
+		progress = Progress(10, fps=1000)
+		progress.update()
+		time.sleep(0.05)
+		progress.close()
+		self.assertEqual(1, sys.stdout.getvalue().count("(1/10)"))
+
+	def test_should_not_exceed_bar_when_overdone(self):
+		with Progress(2, width=4) as progress:
+			progress.update(3)
+		self.assertTrue(sys.stdout.getvalue().endswith("\r[####] 100% (3/2)\n"))
+
+	def test_should_send_messages_in_protocol_mode(self):
+		configure('protocol', True)
+		with Progress(4, "Copying", fps=1) as progress:
+			progress.update(2)
+		self.assertEqual('{"type": "progress", "text": "Copying", "value": 2, "total": 4}\n', sys.stdout.getvalue())
+
+
+
+class Test_Spinner(IOTestCase):
+
+	def test_should_turn_on_progress(self):
+		spinner = Spinner("Waiting", fps=1)
+		spinner.refresh()
+		spinner.update()
+		spinner.refresh()
+		spinner.refresh()
+		spinner.close()
+		self.assertEqual("\rWaiting / 0\rWaiting - 1\n", sys.stdout.getvalue())
@@ -0,0 +1,77 @@
+"""
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from simplemenus.ranking import Ranking
+
+class Test_Ranking(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.path = os.path.join(self.directory, 'ranking')
+		self.rankings = []
+
+	def tearDown(self):
+		for ranking in self.rankings:
+			ranking.close()
+		shutil.rmtree(self.directory)
+
+	def ranking(self, path = None):
+		ranking = Ranking(path)
+		self.rankings.append(ranking)
+		return ranking
+
+	def test_should_rank_frequent_entries_first(self):
+		ranking = self.ranking()
+		for label in ['b', 'a', 'b', 'c', 'b', 'a']:
+			ranking.choose('menu', label)
+		self.assertEqual([1, 0, 2], ranking.top('menu', ['a', 'b', 'c', 'd'], 5))
+
+	def test_should_let_recent_entries_overtake_old_ones(self):
+		ranking = self.ranking()
+		for i in range(5):
+			ranking.choose('menu', 'old')
+		for i in range(30):
+			ranking.choose('menu', 'new')
+		ranking.choose('menu', 'other')
+		self.assertEqual([1, 2, 0], ranking.top('menu', ['old', 'new', 'other'], 3))
+
+	def test_should_keep_menus_apart_and_skip_missing_labels(self):
+		ranking = self.ranking()
+		ranking.choose('one', 'a')
+		ranking.choose('two', 'b')
+		self.assertEqual([], ranking.top('one', ['b', 'c'], 3))
+		self.assertEqual([0], ranking.top('two', ['b', 'c'], 3))
+		self.assertEqual([], ranking.top('three', ['b', 'c'], 3))
+
+	def test_should_limit_count(self):
+		ranking = self.ranking()
+		for label in 'abcd':
+			ranking.choose('menu', label)
+		self.assertEqual([3, 2], ranking.top('menu', list('abcd'), 2))
+
+	def test_should_persist_and_compact(self):
+		ranking = self.ranking(self.path)
+		for label in ['a', 'b', 'b', 'b', 'a']:
+			ranking.choose('menu', label)
+		ranking.close()
+
+		loaded = self.ranking(self.path)
+		self.assertEqual(ranking.top('menu', ['a', 'b'], 2), loaded.top('menu', ['a', 'b'], 2))
+		with open(self.path) as f:
+			self.assertEqual(2, len(f.readlines()))
+
+		loaded.choose('menu', 'a')
+		self.assertEqual(loaded._ticks['menu'], 6)
+
+	def test_should_ignore_torn_lines(self):
+		with open(self.path, 'w') as f:
+			f.write('["menu", "a", 0.1, 1]\n["menu", "b"')
+		self.assertEqual([0], self.ranking(self.path).top('menu', ['a', 'b'], 2))
+
+if __name__ == '__main__':
+	unittest.main()
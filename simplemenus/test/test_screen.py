@@ -0,0 +1,38 @@
+"""
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import unittest
+import io
+from simplemenus.screen import Screen
+
+class Test_Screen(unittest.TestCase):
+
+	def setUp(self):
+		self.screen = Screen()
+		self.screen.draw(['one', 'two', 'three'], io.StringIO())
+
+	def draw(self, lines):
+		stream = io.StringIO()
+		self.screen.draw(lines, stream)
+		return stream.getvalue()
+
+	def test_should_clear_screen_on_first_draw(self):
+		self.screen = Screen()
+		self.assertEqual('\x1b[H\x1b[2Jone\ntwo\n', self.draw(['one', 'two']))
+
+	def test_should_only_write_changed_lines(self):
+		self.assertEqual('\x1b[2;1H\x1b[2KTWO\x1b[4;1H\x1b[J', self.draw(['one', 'TWO', 'three']))
+
+	def test_should_only_clear_below_when_nothing_changed(self):
+		self.assertEqual('\x1b[4;1H\x1b[J', self.draw(['one', 'two', 'three']))
+
+	def test_should_clear_removed_lines(self):
+		self.assertEqual('\x1b[2;1H\x1b[J', self.draw(['one']))
+
+	def test_should_write_added_lines(self):
+		self.assertEqual('\x1b[4;1H\x1b[2Kfour\x1b[5;1H\x1b[J', self.draw(['one', 'two', 'three', 'four']))
+
+	def test_should_repaint_everything_after_invalidate(self):
+		self.screen.invalidate()
+		self.assertEqual('\x1b[H\x1b[2Jone\ntwo\nthree\n', self.draw(['one', 'two', 'three']))
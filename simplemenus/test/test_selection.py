@@ -0,0 +1,44 @@
+"""
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import unittest
+from simplemenus.selection import Selection
+
+class Test_Selection(unittest.TestCase):
+
+	def setUp(self):
+		self.selection = Selection(100)
+
+	def test_should_be_empty(self):
+		self.assertEqual(0, len(self.selection))
+		self.assertEqual([], list(self.selection))
+
+	def test_should_toggle(self):
+		self.selection.toggle(9)
+		self.assertIn(9, self.selection)
+		self.selection.toggle(9)
+		self.assertNotIn(9, self.selection)
+
+	def test_should_set_ranges_across_bytes(self):
+		self.selection.set_range(3, 30)
+		self.assertEqual(list(range(3, 30)), list(self.selection))
+
+	def test_should_set_ranges_within_one_byte(self):
+		self.selection.set_range(2, 5)
+		self.assertEqual([2, 3, 4], list(self.selection))
+
+	def test_should_clear_ranges(self):
+		self.selection.set_range(0, 100)
+		self.selection.set_range(5, 95, False)
+		self.assertEqual([0, 1, 2, 3, 4, 95, 96, 97, 98, 99], list(self.selection))
+		self.assertEqual(10, len(self.selection))
+
+	def test_should_not_touch_bits_beyond_size(self):
+		selection = Selection(10)
+		selection.set_range(0, 10)
+		self.assertEqual(10, len(selection))
+
+	def test_should_reject_indices_out_of_range(self):
+		self.assertRaises(IndexError, self.selection.toggle, 100)
+		self.assertRaises(IndexError, self.selection.set_range, 0, 101)
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import unittest
+from simplemenus.width import *
+
+RED = u'\x1b[31m'
+RESET = u'\x1b[0m'
+
+class Test_display_width(unittest.TestCase):
+
+	def test_should_count_ascii_characters(self):
+		self.assertEqual(5, display_width(u'Hello'))
+
+	def test_should_count_wide_characters_twice(self):
+		self.assertEqual(4, display_width(u'日本'))
+		self.assertEqual(3, display_width(u'a🙂'))
+
+	def test_should_not_count_combining_characters(self):
+		self.assertEqual(1, display_width(u'é'))
+
+	def test_should_not_count_ansi_escapes(self):
+		self.assertEqual(3, display_width(RED + u'red' + RESET))
+		self.assertEqual(u'red', strip_ansi(RED + u'red' + RESET))
+
+
+
+class Test_truncate(unittest.TestCase):
+
+	def test_should_keep_short_text(self):
+		self.assertEqual(u'short', truncate(u'short', 5, u'...'))
+
+	def test_should_add_marker(self):
+		self.assertEqual(u'lo...', truncate(u'longer', 5, u'...'))
+
+	def test_should_not_split_wide_characters(self):
+		self.assertEqual(u'日~', truncate(u'日本語', 4, u'~'))
+
+	def test_should_keep_escapes_and_reset_colors(self):
+		self.assertEqual(RED + u're' + RESET + u'~', truncate(RED + u'red' + RESET + u'!', 3, u'~'))
+
+	def test_should_drop_marker_if_too_wide(self):
+		self.assertEqual(u'lo', truncate(u'long', 2, u'...'))
+
+	def test_ljust(self):
+		self.assertEqual(u'日本  ', ljust(u'日本', 6))
@@ -0,0 +1,33 @@
+"""
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import unittest
+from simplemenus.xgetch import *
+
+def reader(sequence):
+	characters = list(sequence)
+	return lambda: characters.pop(0) if characters else ''
+
+class Test_decode_escape(unittest.TestCase):
+
+	def test_should_decode_cursor_keys(self):
+		self.assertEqual(KEY_UP, decode_escape(reader('[A')))
+		self.assertEqual(KEY_DOWN, decode_escape(reader('OB')))
+
+	def test_should_decode_paging_keys(self):
+		self.assertEqual(KEY_PAGE_UP, decode_escape(reader('[5~')))
+		self.assertEqual(KEY_PAGE_DOWN, decode_escape(reader('[6~')))
+		self.assertEqual(KEY_HOME, decode_escape(reader('[H')))
+		self.assertEqual(KEY_END, decode_escape(reader('[4~')))
+
+	def test_should_return_escape_when_nothing_follows(self):
+		self.assertEqual(KEY_ESCAPE, decode_escape(reader('')))
+
+	def test_should_consume_unknown_sequences_completely(self):
+		read_next = reader('[1;5Cx')
+		self.assertEqual('\x1b[1;5C', decode_escape(read_next))
+		self.assertEqual('x', read_next())
+
+	def test_should_stop_at_timeout_inside_sequence(self):
+		self.assertEqual('\x1b[1', decode_escape(reader('[1')))
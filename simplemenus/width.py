@@ -0,0 +1,74 @@
+"""
+The width of strings on the terminal. Wide characters (i.e. CJK and most emoji)
+take two columns, combining characters and ANSI escape sequences none.
+
+Copyright (c) 2013, Jonas Pfannschmidt
+Licensed under the MIT license http://www.opensource.org/licenses/mit-license.php
+"""
+import re
+import unicodedata
+
+try:
+	from functools import lru_cache
+except ImportError: # Python 2
+	lru_cache = lambda maxsize: lambda function: function
+
+_ANSI = re.compile(r'\x1b\[[0-?]*[ -/]*[@-~]')
+_ANSI_PARTS = re.compile(r'(\x1b\[[0-?]*[ -/]*[@-~])')
+_ASCII = re.compile(r'^[\x00-\x1a\x1c-\x7f]*$') # ASCII without escape
+
+def strip_ansi(text):
+	"""Removes ANSI escape sequences (i.e. colors) from text."""
+	return _ANSI.sub('', text)
+
+def display_width(text):
+	"""How many columns text takes on the terminal."""
+	if _isascii(text):
+		return len(text)
+	return _width(text)
+
+def ljust(text, width):
+	"""Like str.ljust() but uses the display width."""
+	return text + " " * (width - display_width(text))
+
+def truncate(text, width, marker = ''):
+	"""Shortens text to at most width columns and ends it with marker if it was too long."""
+	if display_width(text) <= width:
+		return text
+
+	marker = marker if display_width(marker) <= width else ''
+	available = width - display_width(marker)
+	result = []
+	for part in _ANSI_PARTS.split(text):
+		if _ANSI.match(part):
+			result.append(part)
+			continue
+		for c in part:
+			available -= _character_width(c)
+			if available < 0:
+				break
+			result.append(c)
+		if available < 0:
+			break
+
+	# reset colors in case the cut happened inside a colored part
+	reset = '\x1b[0m' if _ANSI.search(text) else ''
+	return ''.join(result) + reset + marker
+
+def _isascii(text):
+	try:
+		return text.isascii() and '\x1b' not in text
+	except AttributeError: # before Python 3.7
+		return _ASCII.match(text) is not None
+
+@lru_cache(maxsize=4096)
+def _width(text):
+	return sum(_character_width(c) for c in strip_ansi(text))
+
+def _character_width(c):
+	if unicodedata.combining(c) or unicodedata.category(c) in ('Mn', 'Me', 'Cf'):
+		return 0
+	elif unicodedata.east_asian_width(c) in ('W', 'F'):
+		return 2
+	else:
+		return 1
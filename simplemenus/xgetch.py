@@ -2,18 +2,105 @@
 Get single character from standard input on Windows and Unix.
 
 Copied from http://code.activestate.com/recipes/134892/
+
+getkey() extends the recipe: it reads complete escape sequences and returns
+cursor and paging keys by name (see the KEY_* constants) instead of the raw bytes.
 """
 
+KEY_UP = 'up'
+KEY_DOWN = 'down'
+KEY_LEFT = 'left'
+KEY_RIGHT = 'right'
+KEY_HOME = 'home'
+KEY_END = 'end'
+KEY_PAGE_UP = 'pageup'
+KEY_PAGE_DOWN = 'pagedown'
+KEY_INSERT = 'insert'
+KEY_DELETE = 'delete'
+KEY_ESCAPE = 'escape'
+
+# Seconds to wait for the next byte of an escape sequence. Terminals send the
+# whole sequence at once, so anything slower is a lone escape key.
+ESCAPE_TIMEOUT = 0.05
+
+_ESCAPE_SEQUENCES = {
+    '\x1b[A': KEY_UP,
+    '\x1b[B': KEY_DOWN,
+    '\x1b[C': KEY_RIGHT,
+    '\x1b[D': KEY_LEFT,
+    '\x1bOA': KEY_UP,
+    '\x1bOB': KEY_DOWN,
+    '\x1bOC': KEY_RIGHT,
+    '\x1bOD': KEY_LEFT,
+    '\x1b[H': KEY_HOME,
+    '\x1b[F': KEY_END,
+    '\x1bOH': KEY_HOME,
+    '\x1bOF': KEY_END,
+    '\x1b[1~': KEY_HOME,
+    '\x1b[7~': KEY_HOME,
+    '\x1b[4~': KEY_END,
+    '\x1b[8~': KEY_END,
+    '\x1b[2~': KEY_INSERT,
+    '\x1b[3~': KEY_DELETE,
+    '\x1b[5~': KEY_PAGE_UP,
+    '\x1b[6~': KEY_PAGE_DOWN,
+}
+
+# msvcrt reports special keys as '\x00' or '\xe0' followed by a scan code
+_WINDOWS_SCAN_CODES = {
+    'H': KEY_UP,
+    'P': KEY_DOWN,
+    'K': KEY_LEFT,
+    'M': KEY_RIGHT,
+    'G': KEY_HOME,
+    'O': KEY_END,
+    'I': KEY_PAGE_UP,
+    'Q': KEY_PAGE_DOWN,
+    'R': KEY_INSERT,
+    'S': KEY_DELETE,
+}
+
+
+def decode_escape(read_next):
+    """Decode the rest of an escape sequence after '\\x1b' has been read.
+
+    read_next() must return the next character or '' if nothing arrives in time.
+    Known sequences are returned as KEY_* names. Unknown sequences are consumed
+    completely and returned as they are, so they don't leak into the next read.
+    """
+    ch = read_next()
+    if not ch:
+        return KEY_ESCAPE
+
+    sequence = '\x1b' + ch
+    if ch == 'O':
+        # SS3: exactly one more character
+        sequence += read_next()
+    elif ch == '[':
+        # CSI: parameter bytes followed by one final byte in the range '@'..'~'
+        while True:
+            ch = read_next()
+            sequence += ch
+            if not ch or '@' <= ch <= '~':
+                break
+
+    return _ESCAPE_SEQUENCES.get(sequence, sequence)
+
+
 class _Getch:
     """Gets a single character from standard input.  Does not echo to the
 screen."""
     def __init__(self):
-        try:
-            self.impl = _GetchWindows()
-        except ImportError:
-            self.impl = _GetchUnix()
+        self.impl = None
 
-    def __call__(self): return self.impl()
+    def __call__(self):
+        # Choose the implementation on first use, so importing this module stays cheap
+        if self.impl is None:
+            try:
+                self.impl = _GetchWindows()
+            except ImportError:
+                self.impl = _GetchUnix()
+        return self.impl()
 
 
 class _GetchUnix:
@@ -41,5 +128,67 @@ class _GetchWindows:
         return msvcrt.getch()
 
 
+class _Getkey:
+    """Gets a single key from standard input. Special keys are returned by name
+(see the KEY_* constants), everything else as a single character."""
+    def __init__(self):
+        self.impl = None
+
+    def __call__(self):
+        # Choose the implementation on first use, so importing this module stays cheap
+        if self.impl is None:
+            try:
+                self.impl = _GetkeyWindows()
+            except ImportError:
+                self.impl = _GetkeyUnix()
+        return self.impl()
+
+
+class _GetkeyUnix:
+    def __init__(self):
+        import tty, termios
+
+    def __call__(self):
+        import sys, os, tty, termios, select, codecs
+        fd = sys.stdin.fileno()
+        decoder = codecs.getincrementaldecoder(getattr(sys.stdin, 'encoding', None) or 'utf-8')('replace')
+
+        def read_char(timeout=None):
+            # Read bytes until they form one character. Bypasses sys.stdin's
+            # buffer, otherwise select() wouldn't see bytes that are already buffered.
+            while True:
+                if timeout is not None and not select.select([fd], [], [], timeout)[0]:
+                    return ''
+                byte = os.read(fd, 1)
+                if not byte:
+                    return ''
+                ch = decoder.decode(byte)
+                if ch:
+                    return ch
+
+        old_settings = termios.tcgetattr(fd)
+        try:
+            tty.setraw(fd)
+            ch = read_char()
+            if ch == '\x1b':
+                ch = decode_escape(lambda: read_char(ESCAPE_TIMEOUT))
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        return ch
+
+
+class _GetkeyWindows:
+    def __init__(self):
+        import msvcrt
+
+    def __call__(self):
+        import msvcrt
+        ch = msvcrt.getwch()
+        if ch in ('\x00', '\xe0'):
+            code = msvcrt.getwch()
+            return _WINDOWS_SCAN_CODES.get(code, ch + code)
+        return ch
+
+
 getch = _Getch()
- 
+getkey = _Getkey()